@@ -1,25 +1,32 @@
 """Interactive CLI for Computing & LLM Evolution Analyzer."""
 
+import hashlib
+import heapq
 import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import cached_property
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Optional, Sequence
 
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.table import Table
 from rich.prompt import Prompt, IntPrompt, Confirm
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
 from rich import box
-from rich.layout import Layout
 from rich.text import Text
+from rich.cells import cell_len
 
 from .hardware_analyzer import HardwareAnalyzer
 from .llm_analyzer import LLMAnalyzer
 from .gpu_analyzer import GPUAnalyzer
 from .cloud_cost_analyzer import CloudCostAnalyzer
 from .moores_law import MooresLawAnalyzer
-from .visualizations import Plotter
-from .exports import Exporter
+from .utils import PLOT_FORMAT_VERSION, PNG_COMPRESS_LEVEL
+from . import __version__
 
 # Import new UI components
 from .ui_components import (
@@ -27,12 +34,127 @@ from .ui_components import (
     create_banner, create_menu_option, create_styled_table,
     create_dashboard_panel, create_status_bar, create_help_text,
     create_help_screen, show_help, clear_screen,
-    print_section_header, create_prompt_text,
-    build_choice_validator, normalize_choice,
+    create_section_header, print_section_header, create_prompt_text,
+    build_choice_validator, build_choice_pattern, normalize_choice, ChoicePrompt,
     BreadcrumbNav, Notify
 )
 
 
+# Menu keys are fixed, so build the choice lists and shortcut maps once
+VIZ_NUM_KEYS = ("0", "1", "2", "3", "4", "5", "6", "7", "8", "9", "10", "11", "12")
+VIZ_LETTER_KEYS = ("b", "h", "m", "g", "p", "w", "r", "a", "v", "e", "f", "x", "c")
+VIZ_KEY_MAP = MappingProxyType(dict(zip(VIZ_LETTER_KEYS, VIZ_NUM_KEYS)))
+VIZ_CHOICES = build_choice_validator(list(VIZ_NUM_KEYS), list(VIZ_LETTER_KEYS))
+
+CLOUD_NUM_KEYS = ("0", "1", "2", "3", "4", "5", "6", "7", "8", "9")
+CLOUD_LETTER_KEYS = ("b", "a", "t", "i", "r", "s", "e", "p", "v", "c")
+CLOUD_KEY_MAP = MappingProxyType(dict(zip(CLOUD_LETTER_KEYS, CLOUD_NUM_KEYS)))
+CLOUD_CHOICES = build_choice_validator(list(CLOUD_NUM_KEYS), list(CLOUD_LETTER_KEYS))
+
+
+class VizPrompt(ChoicePrompt):
+    """Visualizations menu prompt."""
+
+    pattern = build_choice_pattern(VIZ_NUM_KEYS, VIZ_LETTER_KEYS)
+
+
+class CloudPrompt(ChoicePrompt):
+    """Cloud cost menu prompt."""
+
+    pattern = build_choice_pattern(CLOUD_NUM_KEYS, CLOUD_LETTER_KEYS)
+
+
+# Display names for the CAGR metrics shown in the comparison view
+PRETTY_METRIC = MappingProxyType({
+    metric: metric.replace('_', ' ').title()
+    for metric in (
+        'cpu_transistors', 'cpu_clock_mhz', 'cpu_cores', 'ram_mb', 'storage_mb', 'performance_mips',
+        'tflops_fp32', 'vram_mb', 'memory_bandwidth_gbps', 'transistors_millions', 'tdp_watts',
+        'parameters_billions', 'training_tokens_billions', 'training_compute_flops', 'context_window',
+    )
+})
+
+
+# Body of the per-provider statistics panel, filled from get_provider_statistics()
+PROVIDER_PANEL_FMT = (
+    "[cyan]Instances:[/cyan] {instance_count}\n"
+    "[cyan]Avg Hourly Cost:[/cyan] ${avg_hourly_cost:.2f}\n"
+    "[cyan]Avg Spot Discount:[/cyan] {avg_spot_discount_percent:.1f}%\n"
+    "[cyan]Total GPUs:[/cyan] {total_gpus}\n"
+    "[cyan]Unique GPU Models:[/cyan] {unique_gpu_models}\n"
+    "[cyan]Training Instances:[/cyan] {training_instances}\n"
+    "[cyan]Inference Instances:[/cyan] {inference_instances}\n"
+    "[cyan]Price Range:[/cyan] ${price_range[min]:.2f} - ${price_range[max]:.2f}/hr\n"
+    "[cyan]GPU Models:[/cyan] {gpu_models}"
+)
+
+# Rows of the instance comparison table: label, spec key and cell format
+INSTANCE_ATTRIBUTES = (
+    ('GPU Model', 'gpu_model', "{}"),
+    ('GPU Count', 'gpu_count', "{}"),
+    ('GPU Memory/GPU', 'gpu_memory_gb', "{}GB"),
+    ('Total GPU Memory', 'total_gpu_memory_gb', "{}GB"),
+    ('vCPUs', 'vcpus', "{}"),
+    ('RAM', 'ram_gb', "{:.0f}GB"),
+    ('TFLOPS FP32', 'tflops_fp32', "{:.1f}"),
+    ('TFLOPS FP16', 'tflops_fp16', "{:.1f}"),
+    ('On-Demand $/hr', 'price_ondemand_hourly', "${:.2f}"),
+    ('Spot $/hr', 'price_spot_hourly', "${:.2f}"),
+    ('TFLOPS/$', 'tflops_per_dollar', "{:.2f}"),
+    ('Cost/GPU/hr', 'cost_per_gpu_hour', "${:.2f}"),
+)
+
+# Sentinel for view cache misses (a cached aggregate may itself be None)
+_MISSING = object()
+
+# Pulls the spot savings table columns out of an analysis entry in one call
+SPOT_ROW_FIELDS = itemgetter(
+    'provider', 'instance_type', 'gpu_model', 'ondemand_hourly',
+    'spot_hourly', 'savings_percent', 'annual_savings_usd'
+)
+
+
+# Record fields each group of charts reads; only these go into the chart fingerprint
+GPU_PLOT_FIELDS = attrgetter(
+    'name', 'manufacturer', 'year', 'tflops_fp32', 'vram_mb', 'tdp_watts', 'launch_price_usd'
+)
+LLM_PLOT_FIELDS = attrgetter(
+    'name', 'year', 'parameters_billions', 'context_window',
+    'capability_score_reasoning', 'capability_score_coding', 'capability_score_math',
+    'capability_score_knowledge', 'capability_score_multilingual',
+)
+MOORE_PLOT_FIELDS = attrgetter('year', 'cpu_transistors')
+
+
+def _fingerprint(*parts: Any) -> str:
+    """Hash plot inputs so charts with unchanged data can be skipped.
+
+    The package version, chart format version and PNG compression level are
+    mixed in, so upgrades and setting changes redraw existing charts.
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(repr((__version__, PLOT_FORMAT_VERSION, PNG_COMPRESS_LEVEL)).encode())
+    for part in parts:
+        digest.update(part if isinstance(part, bytes) else repr(part).encode())
+    return digest.hexdigest()
+
+
+def _column_widths(headers: Sequence[str], rows: Sequence[Sequence[str]]) -> List[int]:
+    """Widest line in each column (header included) so Rich can skip measuring cells."""
+    return [
+        max(cell_len(line) for cell in column for line in cell.splitlines() or [""])
+        for column in zip(headers, *rows)
+    ]
+
+
+def _fit_widths(widths: List[int], available: int) -> List[Optional[int]]:
+    """Use fixed widths only when the table fits; otherwise let Rich wrap columns."""
+    # Each column adds one cell of padding per side plus a border
+    if sum(widths) + 3 * len(widths) + 1 <= available:
+        return list(widths)
+    return [None] * len(widths)
+
+
 class CLI:
     """Interactive command-line interface."""
 
@@ -44,10 +166,161 @@ class CLI:
         self.gpu_analyzer = None
         self.cloud_cost_analyzer = None
         self.moores_law = MooresLawAnalyzer()
-        self.plotter = Plotter()
-        self.exporter = Exporter()
         self.breadcrumbs = BreadcrumbNav()
 
+        # Analyzer aggregates are static per load, so views memoize them here
+        self._view_cache: Dict[Any, Any] = {}
+        self._view_lock = threading.Lock()
+
+        # Cloud views save their charts here while the user reads the table
+        self._pool = ThreadPoolExecutor(max_workers=1)
+        self._plot_hashes: Dict[Path, str] = {}
+
+        # Charts are written here; create it once instead of per plot
+        self.output_dir = Path("output")
+        self.output_dir.mkdir(exist_ok=True)
+
+        # Main menu choice -> handler, bound once
+        self._menu: Dict[str, Callable[[], None]] = {
+            "1": self.hardware_analysis_menu,
+            "2": self.llm_analysis_menu,
+            "3": self.gpu_analysis_menu,
+            "4": self.moores_law_menu,
+            "5": self.comparison_menu,
+            "6": self.export_menu,
+            "7": self.visualizations_menu,
+            "8": self.cloud_cost_analysis_menu,
+        }
+
+    @cached_property
+    def plotter(self):
+        """Plotter, imported on first use to keep matplotlib out of startup."""
+        # Charts are only ever written to files, so skip GUI backend setup
+        import matplotlib
+        matplotlib.use("Agg")
+
+        from .visualizations import Plotter
+        return Plotter()
+
+    @cached_property
+    def exporter(self):
+        """Exporter, imported on first use to keep pandas out of startup."""
+        from .exports import Exporter
+        return Exporter()
+
+    @staticmethod
+    def _hash_sidecar(output_path: Path) -> Path:
+        """Where the fingerprint of a saved chart is kept between sessions.
+
+        Fingerprints live in a hidden .plot_hashes folder beside the charts, so
+        the output folder itself only holds files the user asked for. Deleting
+        the folder just makes every chart redraw once.
+        """
+        return output_path.parent / ".plot_hashes" / (output_path.name + ".hash")
+
+    def _plot_is_current(self, output_path: Path, fingerprint: str) -> bool:
+        """Check whether output_path was already rendered from the same data."""
+        if not output_path.exists():
+            return False
+        if self._plot_hashes.get(output_path) == fingerprint:
+            return True
+
+        sidecar = self._hash_sidecar(output_path)
+        if sidecar.exists() and sidecar.read_text() == fingerprint:
+            self._plot_hashes[output_path] = fingerprint
+            return True
+        return False
+
+    def _record_plot(self, output_path: Path, fingerprint: str) -> None:
+        """Store the data fingerprint of a freshly rendered plot."""
+        sidecar = self._hash_sidecar(output_path)
+        sidecar.parent.mkdir(exist_ok=True)
+        sidecar.write_text(fingerprint)
+        self._plot_hashes[output_path] = fingerprint
+
+    def _submit_plot(
+        self, output_path: Path, fingerprint: str, plot: str, *args: Any, **kwargs: Any
+    ) -> Optional[Future]:
+        """Render a chart on the background pool unless it is already current.
+
+        Args:
+            output_path: Where the chart is saved
+            fingerprint: Hash of the data the chart is drawn from
+            plot: Name of the Plotter method to call; looked up only when the
+                chart has to be drawn, so current charts never import matplotlib
+            *args: Positional arguments for the plotter method
+            **kwargs: Keyword arguments for the plotter method
+
+        Returns:
+            Future for the render, or None if the existing file is up to date
+        """
+        if self._plot_is_current(output_path, fingerprint):
+            self.console.print(f"\n[green]✓ Visualization up to date: {output_path}[/green]")
+            return None
+
+        # Resolve the plotter here rather than on the worker, so it is only
+        # ever created on this thread
+        plot_method = getattr(self.plotter, plot)
+
+        def render():
+            plot_method(*args, output_path=output_path, **kwargs)
+            self._record_plot(output_path, fingerprint)
+
+        self.console.print(f"\n[green]Saving visualization to {output_path}[/green]")
+        return self._pool.submit(render)
+
+    def _cached_view(self, key: Any, compute: Callable[[], Any]) -> Any:
+        """Return a memoized analyzer aggregate, computing it on first use.
+
+        Args:
+            key: Cache key (view name, plus arguments where relevant)
+            compute: Zero-argument callable producing the aggregate
+
+        Returns:
+            The cached aggregate
+        """
+        with self._view_lock:
+            value = self._view_cache.get(key, _MISSING)
+
+        if isinstance(value, Future):
+            # Prefetched in the background; wait for it and keep the result
+            value = value.result()
+            with self._view_lock:
+                self._view_cache[key] = value
+        elif value is _MISSING:
+            value = compute()
+            with self._view_lock:
+                value = self._view_cache.setdefault(key, value)
+        return value
+
+    def _prefetch_views(self, views: Dict[Any, Callable[[], Any]]) -> None:
+        """Start computing view aggregates on the background pool.
+
+        Args:
+            views: Cache key -> zero-argument callable, as for _cached_view
+        """
+        with self._view_lock:
+            for key, compute in views.items():
+                if key not in self._view_cache:
+                    self._view_cache[key] = self._pool.submit(compute)
+
+    def _print_rendered(self, key: Any, build: Callable[[], Any]) -> None:
+        """Print a large renderable, reusing its rendered text on later visits.
+
+        The output is cached per console width, so the layout pass only runs
+        again after the data is reloaded or the terminal is resized.
+
+        Args:
+            key: Cache key for the rendered output
+            build: Zero-argument callable producing the renderable
+        """
+        def render() -> str:
+            with self.console.capture() as capture:
+                self.console.print(build())
+            return capture.get()
+
+        self.console.file.write(self._cached_view((key, self.console.width), render))
+
     def show_banner(self):
         """Display application banner."""
         self.console.print(create_banner())
@@ -143,6 +416,10 @@ class CLI:
             self.cloud_cost_analyzer = CloudCostAnalyzer()
             progress.update(task4, completed=True)
 
+        # Fresh data invalidates any memoized views
+        with self._view_lock:
+            self._view_cache.clear()
+
         Notify.success(self.console, "All data loaded successfully!", "Ready to analyze")
 
         # Show dashboard
@@ -623,7 +900,7 @@ class CLI:
     def show_capability_comparison(self):
         """Display capability score comparison."""
         # Get latest models
-        latest_models = sorted(self.llm_analyzer.models, key=lambda m: m.year, reverse=True)[:10]
+        latest_models = heapq.nlargest(10, self.llm_analyzer.models, key=attrgetter('year'))
 
         table = Table(title="LLM Capability Scores", box=box.ROUNDED)
         table.add_column("Model", style="green")
@@ -1254,7 +1531,7 @@ class CLI:
             default="json"
         )
 
-        data = self.hw_analyzer.to_dict()
+        data = self._cached_view('hardware_export', self.hw_analyzer.to_dict)
 
         with Progress(
             SpinnerColumn(),
@@ -1288,7 +1565,7 @@ class CLI:
             default="json"
         )
 
-        data = self.llm_analyzer.to_dict()
+        data = self._cached_view('llm_export', self.llm_analyzer.to_dict)
 
         try:
             if format_choice == "json":
@@ -1312,7 +1589,7 @@ class CLI:
             default="json"
         )
 
-        data = self.gpu_analyzer.to_dict()
+        data = self._cached_view('gpu_export', self.gpu_analyzer.to_dict)
 
         try:
             if format_choice == "json":
@@ -1328,17 +1605,23 @@ class CLI:
         except Exception as e:
             self.console.print(f"[red]Error exporting: {e}[/red]")
 
+    def _cagr_payload(self) -> Dict[str, Dict[str, Any]]:
+        """CAGR results of every analyzer as plain dicts, shared by the report exports."""
+        return self._cached_view('cagr_export', lambda: {
+            "hardware_cagr": {k: v.to_dict() for k, v in self.hw_analyzer.calculate_all_cagrs().items()},
+            "gpu_cagr": {k: v.to_dict() for k, v in self.gpu_analyzer.calculate_all_cagrs().items()},
+            "llm_cagr": {k: v.to_dict() for k, v in self.llm_analyzer.calculate_all_cagrs().items()},
+        })
+
     def export_cagr_analysis(self):
         """Export CAGR analysis."""
-        hw_cagr = self.hw_analyzer.calculate_all_cagrs()
-        llm_cagr = self.llm_analyzer.calculate_all_cagrs()
-        gpu_cagr = self.gpu_analyzer.calculate_all_cagrs()
+        cagr = self._cagr_payload()
 
         analysis_data = {
             "title": "CAGR Analysis Report",
-            "hardware_cagr": {k: v.to_dict() for k, v in hw_cagr.items()},
-            "gpu_cagr": {k: v.to_dict() for k, v in gpu_cagr.items()},
-            "llm_cagr": {k: v.to_dict() for k, v in llm_cagr.items()},
+            "hardware_cagr": cagr["hardware_cagr"],
+            "gpu_cagr": cagr["gpu_cagr"],
+            "llm_cagr": cagr["llm_cagr"],
         }
 
         try:
@@ -1362,9 +1645,7 @@ class CLI:
         ) as progress:
             task = progress.add_task("[cyan]Generating complete report...", total=None)
 
-            hw_cagr = self.hw_analyzer.calculate_all_cagrs()
-            llm_cagr = self.llm_analyzer.calculate_all_cagrs()
-            gpu_cagr = self.gpu_analyzer.calculate_all_cagrs()
+            cagr = self._cagr_payload()
             hw_summary = self.hw_analyzer.get_summary_statistics()
             llm_summary = self.llm_analyzer.get_summary_statistics()
             gpu_summary = self.gpu_analyzer.get_summary_statistics()
@@ -1377,9 +1658,9 @@ class CLI:
                 "hardware_summary": hw_summary,
                 "llm_summary": llm_summary,
                 "gpu_summary": gpu_summary,
-                "hardware_cagr": {k: v.to_dict() for k, v in hw_cagr.items()},
-                "llm_cagr": {k: v.to_dict() for k, v in llm_cagr.items()},
-                "gpu_cagr": {k: v.to_dict() for k, v in gpu_cagr.items()},
+                "hardware_cagr": cagr["hardware_cagr"],
+                "llm_cagr": cagr["llm_cagr"],
+                "gpu_cagr": cagr["gpu_cagr"],
                 "chinchilla_analysis": chinchilla,
                 "moores_law_eras": moores_eras,
             }
@@ -1399,83 +1680,59 @@ class CLI:
         except Exception as e:
             self.console.print(f"[red]Error exporting: {e}[/red]")
 
-    def visualizations_menu(self):
-        """Visualizations submenu."""
-        self.breadcrumbs.push("Visualizations")
-
-        while True:
-            # Show breadcrumbs
-            self.console.print()
-            self.console.print(self.breadcrumbs.render())
-            self.console.print()
-
-            # Menu header
-            print_section_header(self.console, "Generate Visualizations", ICONS['visualize'])
-            self.console.print()
-
+    @cached_property
+    def _viz_menu(self) -> Group:
+        """Static body of the visualizations menu, built once."""
+        section = f"bold {THEME['primary']}"
+        return Group(
+            Text(""),
+            create_section_header("Generate Visualizations", ICONS['visualize']),
+            Text(""),
             # Hardware section
-            self.console.print(Text("  Hardware Charts", style=f"bold {THEME['primary']}"))
-            self.console.print(create_menu_option("1", "h", "Transistor Evolution", "📈",
-                                                 "Log scale hardware trends"))
-            self.console.print(create_menu_option("2", "m", "Moore's Law Comparison", "🎯",
-                                                 "Predicted vs actual"))
-            self.console.print(create_menu_option("3", "g", "Growth Factors", "📊",
-                                                 "Bar chart of growth rates"))
-            self.console.print()
-
+            Text("  Hardware Charts", style=section),
+            create_menu_option("1", "h", "Transistor Evolution", "📈", "Log scale hardware trends"),
+            create_menu_option("2", "m", "Moore's Law Comparison", "🎯", "Predicted vs actual"),
+            create_menu_option("3", "g", "Growth Factors", "📊", "Bar chart of growth rates"),
+            Text(""),
             # LLM section
-            self.console.print(Text("  LLM Charts", style=f"bold {THEME['primary']}"))
-            self.console.print(create_menu_option("4", "p", "Parameter Scaling", "🤖",
-                                                 "Model size over time"))
-            self.console.print(create_menu_option("5", "w", "Context Window Evolution", "📏",
-                                                 "Context length trends"))
-            self.console.print(create_menu_option("6", "r", "Capability Radar", "⭐",
-                                                 "Multi-dimensional scores"))
-            self.console.print()
-
+            Text("  LLM Charts", style=section),
+            create_menu_option("4", "p", "Parameter Scaling", "🤖", "Model size over time"),
+            create_menu_option("5", "w", "Context Window Evolution", "📏", "Context length trends"),
+            create_menu_option("6", "r", "Capability Radar", "⭐", "Multi-dimensional scores"),
+            Text(""),
             # GPU section
-            self.console.print(Text("  GPU Charts", style=f"bold {THEME['primary']}"))
-            self.console.print(create_menu_option("7", "a", "Performance Evolution", "🚀",
-                                                 "TFLOPS over time"))
-            self.console.print(create_menu_option("8", "v", "Memory Evolution", "💾",
-                                                 "VRAM capacity trends"))
-            self.console.print(create_menu_option("9", "e", "Efficiency Trends", "⚡",
-                                                 "TFLOPS per watt"))
-            self.console.print(create_menu_option("10", "f", "Manufacturer Comparison", "🏭",
-                                                 "NVIDIA vs AMD vs Intel"))
-            self.console.print(create_menu_option("11", "x", "Price vs Performance", "💰",
-                                                 "Value analysis"))
-            self.console.print()
-
+            Text("  GPU Charts", style=section),
+            create_menu_option("7", "a", "Performance Evolution", "🚀", "TFLOPS over time"),
+            create_menu_option("8", "v", "Memory Evolution", "💾", "VRAM capacity trends"),
+            create_menu_option("9", "e", "Efficiency Trends", "⚡", "TFLOPS per watt"),
+            create_menu_option("10", "f", "Manufacturer Comparison", "🏭", "NVIDIA vs AMD vs Intel"),
+            create_menu_option("11", "x", "Price vs Performance", "💰", "Value analysis"),
+            Text(""),
             # Analysis charts
-            self.console.print(Text("  Analysis Charts", style=f"bold {THEME['primary']}"))
-            self.console.print(create_menu_option("12", "c", "CAGR Heatmap", "🌡️",
-                                                 "Growth rate visualization"))
-            self.console.print()
+            Text("  Analysis Charts", style=section),
+            create_menu_option("12", "c", "CAGR Heatmap", "🌡️", "Growth rate visualization"),
+            Text(""),
+            create_menu_option("0", "b", "Back", ICONS['back'], "Return to main menu"),
+            Text(""),
+            create_status_bar("Visualizations", "Charts saved to output/ directory"),
+            Text(""),
+        )
 
-            self.console.print(create_menu_option("0", "b", "Back", ICONS['back'],
-                                                 "Return to main menu"))
+    def visualizations_menu(self):
+        """Visualizations submenu."""
+        self.breadcrumbs.push("Visualizations")
 
-            self.console.print()
-            self.console.print(create_status_bar("Visualizations", "Charts saved to output/ directory"))
-            self.console.print()
+        while True:
+            # Breadcrumbs and the static menu body in a single write
+            self.console.print(Group(Text(""), self.breadcrumbs.render(), self._viz_menu))
 
             # Get choice
-            num_keys = ["0", "1", "2", "3", "4", "5", "6", "7", "8", "9", "10", "11", "12"]
-            letter_keys = ["b", "h", "m", "g", "p", "w", "r", "a", "v", "e", "f", "x", "c"]
-            valid_choices = build_choice_validator(num_keys, letter_keys)
-
-            key_map = {
-                "b": "0", "h": "1", "m": "2", "g": "3", "p": "4", "w": "5", "r": "6",
-                "a": "7", "v": "8", "e": "9", "f": "10", "x": "11", "c": "12"
-            }
-
-            choice = Prompt.ask(
+            choice = VizPrompt.ask(
                 create_prompt_text("Your choice"),
-                choices=valid_choices,
+                choices=VIZ_CHOICES,
                 default="1"
             )
-            choice = normalize_choice(choice, key_map)
+            choice = VIZ_KEY_MAP.get(choice, choice)
 
             if choice == "0":
                 self.breadcrumbs.pop()
@@ -1513,8 +1770,12 @@ class CLI:
             default="cpu_transistors"
         )
 
-        output_path = Path("output") / f"hardware_{metric}_evolution.png"
-        output_path.parent.mkdir(exist_ok=True)
+        output_path = self.output_dir / f"hardware_{metric}_evolution.png"
+
+        fingerprint = _fingerprint(metric, self.hw_analyzer.years.tobytes(), self.hw_analyzer.columns[metric].tobytes())
+        if self._plot_is_current(output_path, fingerprint):
+            Notify.info(self.console, "Plot Up To Date", f"Data unchanged, reusing: {output_path}")
+            return
 
         with Progress(
             SpinnerColumn(),
@@ -1524,12 +1785,14 @@ class CLI:
             task = progress.add_task(f"[cyan]📈 Generating {metric} plot...", total=None)
 
             try:
-                self.plotter.plot_hardware_evolution(
-                    self.hw_analyzer.systems,
+                self.plotter.plot_hardware_evolution_arr(
+                    self.hw_analyzer.years,
+                    self.hw_analyzer.columns[metric],
                     metric,
                     output_path,
                     log_scale=True
                 )
+                self._record_plot(output_path, fingerprint)
                 progress.update(task, completed=True)
                 Notify.success(self.console, "Plot Generated!", f"Saved to: {output_path}")
             except Exception as e:
@@ -1550,14 +1813,19 @@ class CLI:
             )
             predictions.append(pred)
 
-        output_path = Path("output") / "moores_law_comparison.png"
-        output_path.parent.mkdir(exist_ok=True)
+        output_path = self.output_dir / "moores_law_comparison.png"
+
+        fingerprint = _fingerprint(list(map(MOORE_PLOT_FIELDS, self.hw_analyzer.systems)), predictions)
+        if self._plot_is_current(output_path, fingerprint):
+            Notify.info(self.console, "Plot Up To Date", f"Data unchanged, reusing: {output_path}")
+            return
 
         with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}"),
                      console=self.console) as progress:
             task = progress.add_task(f"[cyan]🎯 Generating Moore's Law comparison...", total=None)
             try:
                 self.plotter.plot_moores_law_comparison(self.hw_analyzer.systems, predictions, output_path)
+                self._record_plot(output_path, fingerprint)
                 progress.update(task, completed=True)
                 Notify.success(self.console, "Plot Generated!", f"Saved to: {output_path}")
             except Exception as e:
@@ -1569,14 +1837,19 @@ class CLI:
         results = self.hw_analyzer.calculate_all_cagrs()
         cagr_data = {k: v.cagr_percent for k, v in results.items()}
 
-        output_path = Path("output") / "cagr_heatmap.png"
-        output_path.parent.mkdir(exist_ok=True)
+        output_path = self.output_dir / "cagr_heatmap.png"
+
+        fingerprint = _fingerprint(cagr_data)
+        if self._plot_is_current(output_path, fingerprint):
+            Notify.info(self.console, "Plot Up To Date", f"Data unchanged, reusing: {output_path}")
+            return
 
         with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}"),
                      console=self.console) as progress:
             task = progress.add_task(f"[cyan]🌡️ Generating CAGR heatmap...", total=None)
             try:
                 self.plotter.plot_cagr_heatmap(cagr_data, output_path)
+                self._record_plot(output_path, fingerprint)
                 progress.update(task, completed=True)
                 Notify.success(self.console, "Plot Generated!", f"Saved to: {output_path}")
             except Exception as e:
@@ -1585,28 +1858,38 @@ class CLI:
 
     def plot_llm_parameters(self):
         """Plot LLM parameter scaling."""
-        output_path = Path("output") / "llm_parameter_scaling.png"
-        output_path.parent.mkdir(exist_ok=True)
+        output_path = self.output_dir / "llm_parameter_scaling.png"
+
+        fingerprint = _fingerprint(list(map(LLM_PLOT_FIELDS, self.llm_analyzer.models)))
+        if self._plot_is_current(output_path, fingerprint):
+            self.console.print(f"[green]✓ Plot up to date: {output_path}[/green]")
+            return
 
         try:
             self.plotter.plot_llm_parameter_scaling(
                 self.llm_analyzer.models,
                 output_path
             )
+            self._record_plot(output_path, fingerprint)
             self.console.print(f"[green]✓ Plot saved to {output_path}[/green]")
         except Exception as e:
             self.console.print(f"[red]Error creating plot: {e}[/red]")
 
     def plot_context_window(self):
         """Plot context window evolution."""
-        output_path = Path("output") / "context_window_evolution.png"
-        output_path.parent.mkdir(exist_ok=True)
+        output_path = self.output_dir / "context_window_evolution.png"
+
+        fingerprint = _fingerprint(list(map(LLM_PLOT_FIELDS, self.llm_analyzer.models)))
+        if self._plot_is_current(output_path, fingerprint):
+            self.console.print(f"[green]✓ Plot up to date: {output_path}[/green]")
+            return
 
         try:
             self.plotter.plot_context_window_evolution(
                 self.llm_analyzer.models,
                 output_path
             )
+            self._record_plot(output_path, fingerprint)
             self.console.print(f"[green]✓ Plot saved to {output_path}[/green]")
         except Exception as e:
             self.console.print(f"[red]Error creating plot: {e}[/red]")
@@ -1614,13 +1897,18 @@ class CLI:
     def plot_llm_capabilities(self):
         """Plot LLM capability radar chart."""
         # Get latest 5 models
-        latest_models = sorted(self.llm_analyzer.models, key=lambda m: m.year, reverse=True)[:5]
+        latest_models = heapq.nlargest(5, self.llm_analyzer.models, key=attrgetter('year'))
 
-        output_path = Path("output") / "llm_capabilities_radar.png"
-        output_path.parent.mkdir(exist_ok=True)
+        output_path = self.output_dir / "llm_capabilities_radar.png"
+
+        fingerprint = _fingerprint(list(map(LLM_PLOT_FIELDS, latest_models)))
+        if self._plot_is_current(output_path, fingerprint):
+            self.console.print(f"[green]✓ Plot up to date: {output_path}[/green]")
+            return
 
         try:
             self.plotter.plot_llm_capability_radar(latest_models, output_path)
+            self._record_plot(output_path, fingerprint)
             self.console.print(f"[green]✓ Plot saved to {output_path}[/green]")
         except Exception as e:
             self.console.print(f"[red]Error creating plot: {e}[/red]")
@@ -1629,53 +1917,73 @@ class CLI:
         """Plot hardware growth factors."""
         results = self.hw_analyzer.calculate_all_cagrs()
 
-        output_path = Path("output") / "growth_factors.png"
-        output_path.parent.mkdir(exist_ok=True)
+        output_path = self.output_dir / "growth_factors.png"
+
+        fingerprint = _fingerprint({k: v.growth_factor for k, v in results.items()})
+        if self._plot_is_current(output_path, fingerprint):
+            self.console.print(f"[green]✓ Plot up to date: {output_path}[/green]")
+            return
 
         try:
             self.plotter.plot_growth_factors(results, output_path)
+            self._record_plot(output_path, fingerprint)
             self.console.print(f"[green]✓ Plot saved to {output_path}[/green]")
         except Exception as e:
             self.console.print(f"[red]Error creating plot: {e}[/red]")
 
     def plot_gpu_performance(self):
         """Plot GPU performance evolution."""
-        output_path = Path("output") / "gpu_performance_evolution.png"
-        output_path.parent.mkdir(exist_ok=True)
+        output_path = self.output_dir / "gpu_performance_evolution.png"
+
+        fingerprint = _fingerprint(list(map(GPU_PLOT_FIELDS, self.gpu_analyzer.gpus)))
+        if self._plot_is_current(output_path, fingerprint):
+            self.console.print(f"[green]✓ Plot up to date: {output_path}[/green]")
+            return
 
         try:
             self.plotter.plot_gpu_performance_evolution(
                 self.gpu_analyzer.gpus,
                 output_path
             )
+            self._record_plot(output_path, fingerprint)
             self.console.print(f"[green]✓ Plot saved to {output_path}[/green]")
         except Exception as e:
             self.console.print(f"[red]Error creating plot: {e}[/red]")
 
     def plot_gpu_memory(self):
         """Plot GPU memory evolution."""
-        output_path = Path("output") / "gpu_memory_evolution.png"
-        output_path.parent.mkdir(exist_ok=True)
+        output_path = self.output_dir / "gpu_memory_evolution.png"
+
+        fingerprint = _fingerprint(list(map(GPU_PLOT_FIELDS, self.gpu_analyzer.gpus)))
+        if self._plot_is_current(output_path, fingerprint):
+            self.console.print(f"[green]✓ Plot up to date: {output_path}[/green]")
+            return
 
         try:
             self.plotter.plot_gpu_memory_evolution(
                 self.gpu_analyzer.gpus,
                 output_path
             )
+            self._record_plot(output_path, fingerprint)
             self.console.print(f"[green]✓ Plot saved to {output_path}[/green]")
         except Exception as e:
             self.console.print(f"[red]Error creating plot: {e}[/red]")
 
     def plot_gpu_efficiency(self):
         """Plot GPU efficiency trends."""
-        output_path = Path("output") / "gpu_efficiency.png"
-        output_path.parent.mkdir(exist_ok=True)
+        output_path = self.output_dir / "gpu_efficiency.png"
+
+        fingerprint = _fingerprint(list(map(GPU_PLOT_FIELDS, self.gpu_analyzer.gpus)))
+        if self._plot_is_current(output_path, fingerprint):
+            self.console.print(f"[green]✓ Plot up to date: {output_path}[/green]")
+            return
 
         try:
             self.plotter.plot_gpu_efficiency(
                 self.gpu_analyzer.gpus,
                 output_path
             )
+            self._record_plot(output_path, fingerprint)
             self.console.print(f"[green]✓ Plot saved to {output_path}[/green]")
         except Exception as e:
             self.console.print(f"[red]Error creating plot: {e}[/red]")
@@ -1683,25 +1991,35 @@ class CLI:
     def plot_gpu_manufacturer_comp(self):
         """Plot GPU manufacturer comparison."""
         comparison = self.gpu_analyzer.get_manufacturer_comparison()
-        output_path = Path("output") / "gpu_manufacturer_comparison.png"
-        output_path.parent.mkdir(exist_ok=True)
+        output_path = self.output_dir / "gpu_manufacturer_comparison.png"
+
+        fingerprint = _fingerprint(comparison)
+        if self._plot_is_current(output_path, fingerprint):
+            self.console.print(f"[green]✓ Plot up to date: {output_path}[/green]")
+            return
 
         try:
             self.plotter.plot_gpu_manufacturer_comparison(comparison, output_path)
+            self._record_plot(output_path, fingerprint)
             self.console.print(f"[green]✓ Plot saved to {output_path}[/green]")
         except Exception as e:
             self.console.print(f"[red]Error creating plot: {e}[/red]")
 
     def plot_gpu_price_performance(self):
         """Plot GPU price vs performance."""
-        output_path = Path("output") / "gpu_price_performance.png"
-        output_path.parent.mkdir(exist_ok=True)
+        output_path = self.output_dir / "gpu_price_performance.png"
+
+        fingerprint = _fingerprint(list(map(GPU_PLOT_FIELDS, self.gpu_analyzer.gpus)))
+        if self._plot_is_current(output_path, fingerprint):
+            self.console.print(f"[green]✓ Plot up to date: {output_path}[/green]")
+            return
 
         try:
             self.plotter.plot_gpu_price_performance(
                 self.gpu_analyzer.gpus,
                 output_path
             )
+            self._record_plot(output_path, fingerprint)
             self.console.print(f"[green]✓ Plot saved to {output_path}[/green]")
         except Exception as e:
             self.console.print(f"[red]Error creating plot: {e}[/red]")
@@ -1724,69 +2042,63 @@ class CLI:
         gpu_cagr = self.gpu_analyzer.calculate_all_cagrs()
 
         # Hardware summary
-        self.console.print(Text(f"  {ICONS['hardware']} Hardware Evolution (1965-2024)", style=f"bold {THEME['primary']}"))
         hw_table = create_styled_table("", box_style=box.SIMPLE, show_header=False)
         hw_table.add_column("Metric", style=THEME['secondary'])
         hw_table.add_column("CAGR %", justify="right", style=THEME['success'])
 
         for metric, result in hw_cagr.items():
             hw_table.add_row(
-                metric.replace('_', ' ').title(),
+                PRETTY_METRIC.get(metric, metric),
                 f"{result.cagr_percent:.2f}%"
             )
 
-        self.console.print(hw_table)
-        self.console.print()
-
         # GPU summary
-        self.console.print(Text(f"  {ICONS['gpu']} GPU Evolution (1999-2024)", style=f"bold {THEME['primary']}"))
         gpu_table = create_styled_table("", box_style=box.SIMPLE, show_header=False)
         gpu_table.add_column("Metric", style=THEME['secondary'])
         gpu_table.add_column("CAGR %", justify="right", style=THEME['success'])
 
         for metric, result in gpu_cagr.items():
             gpu_table.add_row(
-                metric.replace('_', ' ').title(),
+                PRETTY_METRIC.get(metric, metric),
                 f"{result.cagr_percent:.2f}%"
             )
 
-        self.console.print(gpu_table)
-        self.console.print()
-
         # LLM summary
-        self.console.print(Text(f"  {ICONS['llm']} LLM Evolution (2018-2024)", style=f"bold {THEME['primary']}"))
         llm_table = create_styled_table("", box_style=box.SIMPLE, show_header=False)
         llm_table.add_column("Metric", style=THEME['secondary'])
         llm_table.add_column("CAGR %", justify="right", style=THEME['warning'])
 
         for metric, result in llm_cagr.items():
             llm_table.add_row(
-                metric.replace('_', ' ').title(),
+                PRETTY_METRIC.get(metric, metric),
                 f"{result.cagr_percent:.2f}%"
             )
 
-        self.console.print(llm_table)
-        self.console.print()
-
         # Key insights
-        llm_vs_cpu_ratio = llm_cagr['parameters_billions'].cagr_percent / hw_cagr['cpu_transistors'].cagr_percent
-        gpu_vs_cpu_ratio = gpu_cagr['tflops_fp32'].cagr_percent / hw_cagr['cpu_transistors'].cagr_percent
-
-        panel = Panel(
-            "[cyan]Key Insights:[/cyan]\n"
-            f"• CPU transistors grew {hw_cagr['cpu_transistors'].growth_factor:.1f}x over [bold]59 years[/bold] ({hw_cagr['cpu_transistors'].cagr_percent:.1f}% CAGR)\n"
-            f"• GPU TFLOPS grew {gpu_cagr['tflops_fp32'].growth_factor:.1f}x over [bold]25 years[/bold] ({gpu_cagr['tflops_fp32'].cagr_percent:.1f}% CAGR)\n"
-            f"• GPU VRAM grew {gpu_cagr['vram_mb'].growth_factor:.0f}x over [bold]25 years[/bold] ({gpu_cagr['vram_mb'].cagr_percent:.1f}% CAGR)\n"
-            f"• LLM parameters grew {llm_cagr['parameters_billions'].growth_factor:.1f}x in just [bold]6 years[/bold] ({llm_cagr['parameters_billions'].cagr_percent:.1f}% CAGR)\n"
-            f"  [yellow]⚠[/yellow] LLM CAGR appears {llm_vs_cpu_ratio:.1f}x faster than CPU scaling, [italic]but this is temporary[/italic]\n"
+        cpu_g = hw_cagr['cpu_transistors']
+        gpu_t = gpu_cagr['tflops_fp32']
+        vram = gpu_cagr['vram_mb']
+        llm_p = llm_cagr['parameters_billions']
+        llm_vs_cpu_ratio = llm_p.cagr_percent / cpu_g.cagr_percent
+        gpu_vs_cpu_ratio = gpu_t.cagr_percent / cpu_g.cagr_percent
+
+        lines = [
+            "[cyan]Key Insights:[/cyan]",
+            f"• CPU transistors grew {cpu_g.growth_factor:.1f}x over [bold]59 years[/bold] ({cpu_g.cagr_percent:.1f}% CAGR)",
+            f"• GPU TFLOPS grew {gpu_t.growth_factor:.1f}x over [bold]25 years[/bold] ({gpu_t.cagr_percent:.1f}% CAGR)",
+            f"• GPU VRAM grew {vram.growth_factor:.0f}x over [bold]25 years[/bold] ({vram.cagr_percent:.1f}% CAGR)",
+            f"• LLM parameters grew {llm_p.growth_factor:.1f}x in just [bold]6 years[/bold] ({llm_p.cagr_percent:.1f}% CAGR)",
+            f"  [yellow]⚠[/yellow] LLM CAGR appears {llm_vs_cpu_ratio:.1f}x faster than CPU scaling, [italic]but this is temporary[/italic]",
             f"• GPU performance CAGR is {gpu_vs_cpu_ratio:.1f}x CPU transistor CAGR (more sustainable)",
+        ]
+        panel = Panel(
+            "\n".join(lines),
             title="Comparison Summary",
             border_style="yellow",
         )
-        self.console.print(panel)
 
         # Add important context about the comparison
-        self.console.print(
+        context = (
             "\n[bold yellow]⚠ Important Context:[/bold yellow]\n"
             "[yellow]The LLM scaling rate is NOT directly comparable to hardware trends because:[/yellow]\n"
             "  1. [cyan]Different time periods:[/cyan] 6 years (LLM) vs 59 years (CPU) vs 25 years (GPU)\n"
@@ -1795,66 +2107,75 @@ class CLI:
             "  4. [cyan]Expected slowdown:[/cyan] LLM scaling will normalize to 20-50% CAGR as field matures\n"
         )
 
-        self.console.print()
+        # Render the whole comparison in a single pass
+        self.console.print(Group(
+            Text(f"  {ICONS['hardware']} Hardware Evolution (1965-2024)", style=f"bold {THEME['primary']}"),
+            hw_table,
+            Text(""),
+            Text(f"  {ICONS['gpu']} GPU Evolution (1999-2024)", style=f"bold {THEME['primary']}"),
+            gpu_table,
+            Text(""),
+            Text(f"  {ICONS['llm']} LLM Evolution (2018-2024)", style=f"bold {THEME['primary']}"),
+            llm_table,
+            Text(""),
+            panel,
+            context,
+            Text(""),
+        ))
         self.console.print(create_status_bar("Comparison Complete", "Press Enter to return"))
         Prompt.ask("", default="")
 
         self.breadcrumbs.pop()
 
+    @cached_property
+    def _cloud_menu(self) -> Group:
+        """Static body of the cloud cost menu, built once."""
+        return Group(
+            Text(""),
+            create_section_header("Cloud Cost Analysis", ICONS['cloud']),
+            Text(""),
+            create_menu_option("1", "a", "View All Instances", "📋", "AWS, Azure, GCP inventory"),
+            create_menu_option("2", "t", "Compare Training Costs", "🎓", "Best providers for training"),
+            create_menu_option("3", "i", "Compare Inference Costs", "🚀", "Best providers for serving"),
+            create_menu_option("4", "r", "Cost Efficiency Ranking", "🏆", "TFLOPS per dollar"),
+            create_menu_option("5", "s", "Spot Savings Analysis", "💸", "On-demand vs spot pricing"),
+            create_menu_option("6", "e", "Estimate Training Cost", "🧮", "Calculate LLM training costs"),
+            create_menu_option("7", "p", "GPU Price Evolution", "📈", "Historical pricing trends"),
+            create_menu_option("8", "v", "Provider Statistics", "📊", "AWS vs Azure vs GCP"),
+            create_menu_option("9", "c", "Compare Instances", "⚖️", "Side-by-side comparison"),
+            Text(""),
+            create_menu_option("0", "b", "Back", ICONS['back'], "Return to main menu"),
+            Text(""),
+            create_status_bar("Cloud Costs", "17 instances across 3 providers"),
+            Text(""),
+        )
+
     def cloud_cost_analysis_menu(self):
         """Cloud cost analysis submenu."""
         self.breadcrumbs.push("Cloud Cost Analysis")
 
-        while True:
-            # Show breadcrumbs
-            self.console.print()
-            self.console.print(self.breadcrumbs.render())
-            self.console.print()
-
-            # Menu header
-            print_section_header(self.console, "Cloud Cost Analysis", ICONS['cloud'])
-            self.console.print()
+        # Warm the data-only aggregates while the user picks a view. Index the
+        # catalog here first: the rebuild replaces analyzer.instances and its
+        # tables, which views on this thread read while the prefetch runs
+        analyzer = self.cloud_cost_analyzer
+        analyzer.ensure_indexes()
+        self._prefetch_views({
+            'spot_savings': analyzer.get_spot_savings_analysis,
+            'gpu_price_evolution': analyzer.get_gpu_price_evolution,
+            'provider_stats': analyzer.get_provider_statistics,
+        })
 
-            # Menu options
-            self.console.print(create_menu_option("1", "a", "View All Instances", "📋",
-                                                 "AWS, Azure, GCP inventory"))
-            self.console.print(create_menu_option("2", "t", "Compare Training Costs", "🎓",
-                                                 "Best providers for training"))
-            self.console.print(create_menu_option("3", "i", "Compare Inference Costs", "🚀",
-                                                 "Best providers for serving"))
-            self.console.print(create_menu_option("4", "r", "Cost Efficiency Ranking", "🏆",
-                                                 "TFLOPS per dollar"))
-            self.console.print(create_menu_option("5", "s", "Spot Savings Analysis", "💸",
-                                                 "On-demand vs spot pricing"))
-            self.console.print(create_menu_option("6", "e", "Estimate Training Cost", "🧮",
-                                                 "Calculate LLM training costs"))
-            self.console.print(create_menu_option("7", "p", "GPU Price Evolution", "📈",
-                                                 "Historical pricing trends"))
-            self.console.print(create_menu_option("8", "v", "Provider Statistics", "📊",
-                                                 "AWS vs Azure vs GCP"))
-            self.console.print(create_menu_option("9", "c", "Compare Instances", "⚖️",
-                                                 "Side-by-side comparison"))
-            self.console.print()
-            self.console.print(create_menu_option("0", "b", "Back", ICONS['back'],
-                                                 "Return to main menu"))
-
-            self.console.print()
-            self.console.print(create_status_bar("Cloud Costs", "17 instances across 3 providers"))
-            self.console.print()
+        while True:
+            # Breadcrumbs and the static menu body in a single write
+            self.console.print(Group(Text(""), self.breadcrumbs.render(), self._cloud_menu))
 
             # Get choice
-            num_keys = ["0", "1", "2", "3", "4", "5", "6", "7", "8", "9"]
-            letter_keys = ["b", "a", "t", "i", "r", "s", "e", "p", "v", "c"]
-            valid_choices = build_choice_validator(num_keys, letter_keys)
-
-            key_map = {"b": "0", "a": "1", "t": "2", "i": "3", "r": "4", "s": "5", "e": "6", "p": "7", "v": "8", "c": "9"}
-
-            choice = Prompt.ask(
+            choice = CloudPrompt.ask(
                 create_prompt_text("Your choice"),
-                choices=valid_choices,
+                choices=CLOUD_CHOICES,
                 default="1"
             )
-            choice = normalize_choice(choice, key_map)
+            choice = CLOUD_KEY_MAP.get(choice, choice)
 
             if choice == "0":
                 self.breadcrumbs.pop()
@@ -1884,25 +2205,29 @@ class CLI:
         table.add_column("Provider", style="cyan")
         table.add_column("Instance Type", style="green")
         table.add_column("GPU Model", style="yellow")
-        table.add_column("GPU Count", justify="right")
-        table.add_column("GPU Memory", justify="right")
-        table.add_column("vCPUs", justify="right")
-        table.add_column("RAM (GB)", justify="right")
+        table.add_column("GPU Count", justify="right", style=THEME['success'])
+        table.add_column("GPU Memory", justify="right", style=THEME['success'])
+        table.add_column("vCPUs", justify="right", style=THEME['success'])
+        table.add_column("RAM (GB)", justify="right", style=THEME['success'])
         table.add_column("On-Demand $/hr", justify="right", style="magenta")
         table.add_column("Spot $/hr", justify="right", style="green")
 
-        for instance in self.cloud_cost_analyzer.instances:
-            table.add_row(
-                instance.provider,
-                instance.instance_type,
-                instance.gpu_model,
-                str(instance.gpu_count),
-                f"{instance.gpu_memory_gb}GB",
-                str(instance.vcpus),
-                f"{instance.ram_gb:.0f}",
-                f"${instance.price_ondemand_hourly:.2f}",
-                f"${instance.price_spot_hourly:.2f}" if instance.price_spot_hourly > 0 else "N/A"
+        rows = [
+            (
+                i.provider,
+                i.instance_type,
+                i.gpu_model,
+                str(i.gpu_count),
+                f"{i.gpu_memory_gb}GB",
+                str(i.vcpus),
+                format(i.ram_gb, ".0f"),
+                f"${i.price_ondemand_hourly:.2f}",
+                f"${i.price_spot_hourly:.2f}" if i.price_spot_hourly > 0 else "N/A"
             )
+            for i in self.cloud_cost_analyzer.instances
+        ]
+        for row in rows:
+            table.add_row(*row)
 
         self.console.print(table)
         Prompt.ask("\nPress Enter to continue", default="")
@@ -1935,39 +2260,47 @@ class CLI:
             Prompt.ask("\nPress Enter to continue", default="")
             return
 
+        # Cheapest provider first
+        items = [(provider, data['total_cost_usd'], data) for provider, data in comparison.items()]
+        items.sort(key=itemgetter(1))
+
         table = Table(title=f"Training Cost for {training_hours} Hours", box=box.ROUNDED)
         table.add_column("Provider", style="cyan")
         table.add_column("Instance Type", style="green")
         table.add_column("GPU Model", style="yellow")
-        table.add_column("GPU Count", justify="right")
-        table.add_column("Total TFLOPS", justify="right")
+        table.add_column("GPU Count", justify="right", style=THEME['success'])
+        table.add_column("Total TFLOPS", justify="right", style=THEME['success'])
         table.add_column("Total Cost", justify="right", style="magenta")
-        table.add_column("$/hour", justify="right")
+        table.add_column("$/hour", justify="right", style=THEME['success'])
 
-        for provider, data in sorted(comparison.items(), key=lambda x: x[1]['total_cost_usd']):
-            table.add_row(
+        rows = [
+            (
                 provider,
                 data['instance_type'],
                 data['gpu_model'],
                 str(data['gpu_count']),
-                f"{data['total_tflops_fp32']:.1f}",
+                format(data['total_tflops_fp32'], ".1f"),
                 f"${data['total_cost_usd']:,.2f}",
                 f"${data['hourly_rate']:.2f}"
             )
+            for provider, _, data in items
+        ]
+        for row in rows:
+            table.add_row(*row)
 
         self.console.print(table)
 
         # Visualize
-        output_path = Path("output/cloud_training_comparison.png")
-        output_path.parent.mkdir(exist_ok=True)
-        self.plotter.plot_cloud_cost_comparison(
-            comparison,
-            title=f"Training Cost Comparison ({training_hours} hours)",
-            output_path=output_path
+        output_path = self.output_dir / "cloud_training_comparison.png"
+        title = f"Training Cost Comparison ({training_hours} hours)"
+        future = self._submit_plot(
+            output_path, _fingerprint(comparison, title),
+            'plot_cloud_cost_comparison', comparison, title=title
         )
-        self.console.print(f"\n[green]Visualization saved to {output_path}[/green]")
 
         Prompt.ask("\nPress Enter to continue", default="")
+        if future:
+            future.result()
 
     def _compare_inference_costs(self):
         """Compare cloud providers for inference workload."""
@@ -1996,17 +2329,21 @@ class CLI:
             Prompt.ask("\nPress Enter to continue", default="")
             return
 
+        # Cheapest provider first
+        items = [(provider, data['total_cost_usd'], data) for provider, data in comparison.items()]
+        items.sort(key=itemgetter(1))
+
         table = Table(title=f"Inference Cost for {days} Days", box=box.ROUNDED)
         table.add_column("Provider", style="cyan")
         table.add_column("Instance Type", style="green")
         table.add_column("GPU Model", style="yellow")
-        table.add_column("Instances Needed", justify="right")
+        table.add_column("Instances Needed", justify="right", style=THEME['success'])
         table.add_column("Total Cost", justify="right", style="magenta")
-        table.add_column("Cost/1K Requests", justify="right")
-        table.add_column("Cost/1M Tokens", justify="right")
+        table.add_column("Cost/1K Requests", justify="right", style=THEME['success'])
+        table.add_column("Cost/1M Tokens", justify="right", style=THEME['success'])
 
-        for provider, data in sorted(comparison.items(), key=lambda x: x[1]['total_cost_usd']):
-            table.add_row(
+        rows = [
+            (
                 provider,
                 data['instance_type'],
                 data['gpu_model'],
@@ -2015,20 +2352,24 @@ class CLI:
                 f"${data['cost_per_1k_requests']:.4f}",
                 f"${data['cost_per_1m_tokens']:.2f}"
             )
+            for provider, _, data in items
+        ]
+        for row in rows:
+            table.add_row(*row)
 
         self.console.print(table)
 
         # Visualize
-        output_path = Path("output/cloud_inference_comparison.png")
-        output_path.parent.mkdir(exist_ok=True)
-        self.plotter.plot_cloud_cost_comparison(
-            comparison,
-            title=f"Inference Cost Comparison ({days} days)",
-            output_path=output_path
+        output_path = self.output_dir / "cloud_inference_comparison.png"
+        title = f"Inference Cost Comparison ({days} days)"
+        future = self._submit_plot(
+            output_path, _fingerprint(comparison, title),
+            'plot_cloud_cost_comparison', comparison, title=title
         )
-        self.console.print(f"\n[green]Visualization saved to {output_path}[/green]")
 
         Prompt.ask("\nPress Enter to continue", default="")
+        if future:
+            future.result()
 
     def _show_cost_efficiency(self):
         """Show cost efficiency ranking."""
@@ -2038,7 +2379,7 @@ class CLI:
             default="training"
         )
 
-        ranking = self.cloud_cost_analyzer.get_cost_efficiency_ranking(workload_type=workload)
+        ranking = self.cloud_cost_analyzer.get_cost_efficiency_ranking(workload_type=workload, top_k=15)
 
         table = Table(title=f"Cost Efficiency Ranking ({workload.title()})", box=box.ROUNDED)
         table.add_column("Rank", justify="right", style="cyan")
@@ -2046,61 +2387,79 @@ class CLI:
         table.add_column("Instance Type", style="green")
         table.add_column("GPU Model", style="yellow")
         table.add_column("TFLOPS/$", justify="right", style="magenta")
-        table.add_column("On-Demand $/hr", justify="right")
+        table.add_column("On-Demand $/hr", justify="right", style=THEME['success'])
 
-        for i, instance in enumerate(ranking[:15], 1):
-            table.add_row(
+        rows = [
+            (
                 str(i),
                 instance['provider'],
                 instance['instance_type'],
                 instance['gpu_model'],
-                f"{instance['tflops_per_dollar']:.2f}",
+                format(instance['tflops_per_dollar'], ".2f"),
                 f"${instance['price_ondemand_hourly']:.2f}"
             )
+            for i, instance in enumerate(ranking, 1)
+        ]
+        for row in rows:
+            table.add_row(*row)
 
         self.console.print(table)
 
         # Visualize
-        output_path = Path(f"output/cloud_efficiency_{workload}.png")
-        output_path.parent.mkdir(exist_ok=True)
-        self.plotter.plot_cost_efficiency_ranking(ranking, top_n=10, output_path=output_path)
-        self.console.print(f"\n[green]Visualization saved to {output_path}[/green]")
+        output_path = self.output_dir / f"cloud_efficiency_{workload}.png"
+        future = self._submit_plot(
+            output_path, _fingerprint(ranking, 10),
+            'plot_cost_efficiency_ranking', ranking, top_n=10
+        )
 
         Prompt.ask("\nPress Enter to continue", default="")
+        if future:
+            future.result()
 
     def _show_spot_savings(self):
         """Show spot instance savings analysis."""
-        savings = self.cloud_cost_analyzer.get_spot_savings_analysis()
-
-        table = Table(title="Spot Instance Savings Analysis", box=box.ROUNDED)
-        table.add_column("Provider", style="cyan")
-        table.add_column("Instance Type", style="green")
-        table.add_column("GPU Model", style="yellow")
-        table.add_column("On-Demand $/hr", justify="right")
-        table.add_column("Spot $/hr", justify="right")
-        table.add_column("Savings %", justify="right", style="green")
-        table.add_column("Annual Savings", justify="right", style="magenta")
-
-        for entry in savings[:12]:
-            table.add_row(
-                entry['provider'],
-                entry['instance_type'],
-                entry['gpu_model'],
-                f"${entry['ondemand_hourly']:.2f}",
-                f"${entry['spot_hourly']:.2f}",
-                f"{entry['savings_percent']:.1f}%",
-                f"${entry['annual_savings_usd']:,.0f}"
+        savings = self._cached_view('spot_savings', self.cloud_cost_analyzer.get_spot_savings_analysis)
+
+        # Formatted cells depend only on the data, so build them once
+        rows = self._cached_view('spot_savings_rows', lambda: [
+            (provider, instance_type, gpu_model, f"${ondemand:.2f}", f"${spot:.2f}",
+             f"{percent:.1f}%", f"${annual:,.0f}")
+            for provider, instance_type, gpu_model, ondemand, spot, percent, annual
+            in map(SPOT_ROW_FIELDS, savings[:12])
+        ])
+
+        def build() -> Table:
+            headers = ("Provider", "Instance Type", "GPU Model", "On-Demand $/hr",
+                       "Spot $/hr", "Savings %", "Annual Savings")
+            widths = _fit_widths(
+                self._cached_view('spot_savings_widths', lambda: _column_widths(headers, rows)),
+                self.console.width
             )
 
-        self.console.print(table)
+            table = Table(title="Spot Instance Savings Analysis", box=box.ROUNDED)
+            table.add_column(headers[0], style="cyan", width=widths[0])
+            table.add_column(headers[1], style="green", width=widths[1])
+            table.add_column(headers[2], style="yellow", width=widths[2])
+            table.add_column(headers[3], justify="right", width=widths[3])
+            table.add_column(headers[4], justify="right", width=widths[4])
+            table.add_column(headers[5], justify="right", style="green", width=widths[5])
+            table.add_column(headers[6], justify="right", style="magenta", width=widths[6])
+            for row in rows:
+                table.add_row(*row)
+            return table
+
+        self._print_rendered('spot_savings_table', build)
 
         # Visualize
-        output_path = Path("output/cloud_spot_savings.png")
-        output_path.parent.mkdir(exist_ok=True)
-        self.plotter.plot_spot_savings(savings, top_n=12, output_path=output_path)
-        self.console.print(f"\n[green]Visualization saved to {output_path}[/green]")
+        output_path = self.output_dir / "cloud_spot_savings.png"
+        future = self._submit_plot(
+            output_path, _fingerprint(savings, 12),
+            'plot_spot_savings', savings, top_n=12
+        )
 
         Prompt.ask("\nPress Enter to continue", default="")
+        if future:
+            future.result()
 
     def _estimate_training_cost(self):
         """Estimate LLM training cost."""
@@ -2111,10 +2470,13 @@ class CLI:
             tokens_billions = IntPrompt.ask("Enter training tokens in billions", default=1000)
             use_spot = Confirm.ask("Use spot pricing?", default=True)
 
-            estimate = self.cloud_cost_analyzer.estimate_llm_training_cost(
-                parameters_billions=params_billions,
-                training_tokens_billions=tokens_billions,
-                use_spot=use_spot
+            estimate = self._cached_view(
+                ('training_estimate', params_billions, tokens_billions, use_spot),
+                lambda: self.cloud_cost_analyzer.estimate_llm_training_cost(
+                    parameters_billions=params_billions,
+                    training_tokens_billions=tokens_billions,
+                    use_spot=use_spot
+                )
             )
 
         except ValueError as e:
@@ -2142,72 +2504,87 @@ class CLI:
         self.console.print(panel)
 
         # Visualize
-        output_path = Path("output/cloud_training_estimate.png")
-        output_path.parent.mkdir(exist_ok=True)
-        self.plotter.plot_training_cost_breakdown(estimate, output_path=output_path)
-        self.console.print(f"\n[green]Visualization saved to {output_path}[/green]")
+        output_path = self.output_dir / "cloud_training_estimate.png"
+        future = self._submit_plot(
+            output_path, _fingerprint(estimate),
+            'plot_training_cost_breakdown', estimate
+        )
 
         Prompt.ask("\nPress Enter to continue", default="")
+        if future:
+            future.result()
 
     def _show_gpu_price_evolution(self):
         """Show GPU price evolution over time."""
-        evolution = self.cloud_cost_analyzer.get_gpu_price_evolution()
+        evolution = self._cached_view('gpu_price_evolution', self.cloud_cost_analyzer.get_gpu_price_evolution)
 
-        table = Table(title="GPU Price Evolution", box=box.ROUNDED)
-        table.add_column("GPU Model", style="cyan")
-        table.add_column("Provider", style="green")
-        table.add_column("Year", justify="right")
-        table.add_column("Instance Type", style="yellow")
-        table.add_column("Price $/hr", justify="right", style="magenta")
+        # Flatten the per-GPU history into formatted rows once
+        rows = self._cached_view('gpu_price_evolution_rows', lambda: [
+            (
+                gpu_model,
+                entry['provider'],
+                str(entry['year']),
+                entry['instance_type'],
+                f"${entry['price_ondemand_hourly']:.2f}"
+            )
+            for gpu_model, price_data in evolution.items()
+            for entry in price_data
+        ])
+
+        def build() -> Table:
+            headers = ("GPU Model", "Provider", "Year", "Instance Type", "Price $/hr")
+            widths = _fit_widths(
+                self._cached_view('gpu_price_evolution_widths', lambda: _column_widths(headers, rows)),
+                self.console.width
+            )
 
-        for gpu_model, price_data in evolution.items():
-            for entry in price_data:
-                table.add_row(
-                    gpu_model,
-                    entry['provider'],
-                    str(entry['year']),
-                    entry['instance_type'],
-                    f"${entry['price_ondemand_hourly']:.2f}"
-                )
+            table = Table(title="GPU Price Evolution", box=box.ROUNDED)
+            table.add_column(headers[0], style="cyan", width=widths[0])
+            table.add_column(headers[1], style="green", width=widths[1])
+            table.add_column(headers[2], justify="right", width=widths[2])
+            table.add_column(headers[3], style="yellow", width=widths[3])
+            table.add_column(headers[4], justify="right", style="magenta", width=widths[4])
+            for row in rows:
+                table.add_row(*row)
+            return table
 
-        self.console.print(table)
+        self._print_rendered('gpu_price_evolution_table', build)
 
         # Visualize
-        output_path = Path("output/cloud_gpu_price_evolution.png")
-        output_path.parent.mkdir(exist_ok=True)
-        self.plotter.plot_gpu_price_evolution(evolution, output_path=output_path)
-        self.console.print(f"\n[green]Visualization saved to {output_path}[/green]")
+        output_path = self.output_dir / "cloud_gpu_price_evolution.png"
+        future = self._submit_plot(
+            output_path, _fingerprint(evolution),
+            'plot_gpu_price_evolution', evolution
+        )
 
         Prompt.ask("\nPress Enter to continue", default="")
+        if future:
+            future.result()
 
     def _show_provider_stats(self):
         """Show provider statistics."""
-        stats = self.cloud_cost_analyzer.get_provider_statistics()
+        stats = self._cached_view('provider_stats', self.cloud_cost_analyzer.get_provider_statistics)
+
+        # Start the chart first so it renders while the panels are printed
+        output_path = self.output_dir / "cloud_provider_comparison.png"
+        future = self._submit_plot(
+            output_path, _fingerprint(stats),
+            'plot_provider_comparison_matrix', stats
+        )
+        self.console.print()
 
         for provider, data in stats.items():
             panel = Panel(
-                f"[cyan]Instances:[/cyan] {data['instance_count']}\n"
-                f"[cyan]Avg Hourly Cost:[/cyan] ${data['avg_hourly_cost']:.2f}\n"
-                f"[cyan]Avg Spot Discount:[/cyan] {data['avg_spot_discount_percent']:.1f}%\n"
-                f"[cyan]Total GPUs:[/cyan] {data['total_gpus']}\n"
-                f"[cyan]Unique GPU Models:[/cyan] {data['unique_gpu_models']}\n"
-                f"[cyan]Training Instances:[/cyan] {data['training_instances']}\n"
-                f"[cyan]Inference Instances:[/cyan] {data['inference_instances']}\n"
-                f"[cyan]Price Range:[/cyan] ${data['price_range']['min']:.2f} - ${data['price_range']['max']:.2f}/hr\n"
-                f"[cyan]GPU Models:[/cyan] {', '.join(data['gpu_models'])}",
+                PROVIDER_PANEL_FMT.format_map({**data, 'gpu_models': ', '.join(data['gpu_models'])}),
                 title=f"{provider} Statistics",
                 border_style="cyan"
             )
             self.console.print(panel)
             self.console.print()
 
-        # Visualize
-        output_path = Path("output/cloud_provider_comparison.png")
-        output_path.parent.mkdir(exist_ok=True)
-        self.plotter.plot_provider_comparison_matrix(stats, output_path=output_path)
-        self.console.print(f"[green]Visualization saved to {output_path}[/green]")
-
         Prompt.ask("\nPress Enter to continue", default="")
+        if future:
+            future.result()
 
     def _compare_instances(self):
         """Compare specific instances."""
@@ -2216,7 +2593,8 @@ class CLI:
         self.console.print("Example: p5.48xlarge, Standard_ND96amsr_A100_v4, a2-ultragpu-8g")
 
         instance_types_str = Prompt.ask("\nInstance types")
-        instance_types = [t.strip() for t in instance_types_str.split(',')]
+        # Drop repeated entries but keep the order they were typed in
+        instance_types = list(dict.fromkeys(t.strip() for t in instance_types_str.split(',')))
 
         comparison = self.cloud_cost_analyzer.compare_instance_specs(instance_types)
 
@@ -2224,34 +2602,20 @@ class CLI:
             self.console.print("[red]No instances found with those names[/red]")
             return
 
-        table = Table(title="Instance Comparison", box=box.ROUNDED)
-        table.add_column("Attribute", style="cyan")
-        for instance in comparison:
-            table.add_column(f"{instance['provider']}\n{instance['instance_type']}", style="green")
-
-        attributes = [
-            ('GPU Model', 'gpu_model'),
-            ('GPU Count', 'gpu_count'),
-            ('GPU Memory/GPU', lambda d: f"{d['gpu_memory_gb']}GB"),
-            ('Total GPU Memory', lambda d: f"{d['total_gpu_memory_gb']}GB"),
-            ('vCPUs', 'vcpus'),
-            ('RAM', lambda d: f"{d['ram_gb']:.0f}GB"),
-            ('TFLOPS FP32', lambda d: f"{d['tflops_fp32']:.1f}"),
-            ('TFLOPS FP16', lambda d: f"{d['tflops_fp16']:.1f}"),
-            ('On-Demand $/hr', lambda d: f"${d['price_ondemand_hourly']:.2f}"),
-            ('Spot $/hr', lambda d: f"${d['price_spot_hourly']:.2f}"),
-            ('TFLOPS/$', lambda d: f"{d['tflops_per_dollar']:.2f}"),
-            ('Cost/GPU/hr', lambda d: f"${d['cost_per_gpu_hour']:.2f}"),
+        rendered = [
+            [label] + [template.format(instance[key]) for instance in comparison]
+            for label, key, template in INSTANCE_ATTRIBUTES
+        ]
+        headers = ["Attribute"] + [
+            f"{instance['provider']}\n{instance['instance_type']}" for instance in comparison
         ]
+        widths = _fit_widths(_column_widths(headers, rendered), self.console.width)
 
-        for attr_name, attr_key in attributes:
-            row = [attr_name]
-            for instance in comparison:
-                if callable(attr_key):
-                    value = attr_key(instance)
-                else:
-                    value = str(instance[attr_key])
-                row.append(value)
+        table = Table(title="Instance Comparison", box=box.ROUNDED)
+        table.add_column(headers[0], style="cyan", width=widths[0])
+        for header, width in zip(headers[1:], widths[1:]):
+            table.add_column(header, style="green", width=width)
+        for row in rendered:
             table.add_row(*row)
 
         self.console.print(table)
@@ -2269,22 +2633,10 @@ class CLI:
                 if choice == "0":
                     self.console.print("\n[cyan]Thank you for using the analyzer![/cyan]")
                     break
-                elif choice == "1":
-                    self.hardware_analysis_menu()
-                elif choice == "2":
-                    self.llm_analysis_menu()
-                elif choice == "3":
-                    self.gpu_analysis_menu()
-                elif choice == "4":
-                    self.moores_law_menu()
-                elif choice == "5":
-                    self.comparison_menu()
-                elif choice == "6":
-                    self.export_menu()
-                elif choice == "7":
-                    self.visualizations_menu()
-                elif choice == "8":
-                    self.cloud_cost_analysis_menu()
+
+                handler = self._menu.get(choice)
+                if handler:
+                    handler()
 
         except KeyboardInterrupt:
             self.console.print("\n\n[yellow]Interrupted by user[/yellow]")
@@ -2292,6 +2644,8 @@ class CLI:
             self.console.print(f"\n[red]Error: {e}[/red]")
             import traceback
             traceback.print_exc()
+        finally:
+            self._pool.shutdown()
 
 
 def main():
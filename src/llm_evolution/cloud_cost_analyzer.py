@@ -1,11 +1,87 @@
 """Cloud cost analysis module for ML workloads."""
 
+import functools
 import json
+import threading
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from types import SimpleNamespace
+from typing import List, Dict, Any, Callable, Iterator, Optional, Tuple, TypeVar
 import math
 
-from .models import CloudInstance, ComparisonResult
+import numpy as np
+
+from .models import CLOUD_INSTANCE_FIELDS, CloudInstance, ComparisonResult
+from .utils import load_json
+
+
+# Default catalog, data/cloud/instances.json at the repository root
+_DEFAULT_DATA_PATH = Path(__file__).parent.parent.parent / "data" / "cloud" / "instances.json"
+
+# Instance fields copied into column arrays, in _build_columns unpacking order
+_COLUMN_FIELDS = attrgetter(
+    'provider', 'gpu_model', 'price_ondemand_hourly', 'price_spot_hourly', 'gpu_count',
+    'tflops_fp32', 'tflops_fp16', 'year', 'training_optimized', 'inference_optimized', 'ml_optimized',
+)
+
+
+def _catalog_order(instance: CloudInstance) -> Tuple[str, float]:
+    """Sort key grouping instances by provider, cheapest first."""
+    return (instance.provider.lower(), instance.price_ondemand_hourly)
+
+
+def _rank_rows(rows: np.ndarray, scores: np.ndarray, top_k: Optional[int] = None) -> np.ndarray:
+    """Order rows by descending score, keeping dataset order for ties.
+
+    With top_k, only rows scoring at least the k-th largest value are sorted,
+    so the result equals the head of the full ordering.
+    """
+    if top_k is not None:
+        top_k = max(top_k, 0)
+        if top_k < len(rows):
+            if top_k == 0:
+                return rows[:0]
+            cutoff = np.partition(scores[rows], len(rows) - top_k)[len(rows) - top_k]
+            rows = rows[scores[rows] >= cutoff]
+    # Stable sort on the negated score keeps dataset order for ties, like sort(reverse=True)
+    order = rows[np.argsort(-scores[rows], kind='stable')]
+    return order if top_k is None else order[:top_k]
+
+
+def _or_zero(value: float) -> float:
+    """Undefined (NaN) metric column values are reported as 0, like compute_cost_metrics() lookups."""
+    return 0 if math.isnan(value) else value
+
+
+# Last parse of each catalog file, keyed by resolved path and reused while the file is unchanged
+_PARSED_CATALOGS: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+
+
+def _read_catalog(path: Path) -> Any:
+    """Parse a catalog file, reusing the previous parse if its mtime and size match."""
+    path = Path(path)
+    stat = path.stat()
+    key = str(path.resolve())
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _PARSED_CATALOGS.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    data = load_json(path)
+    _PARSED_CATALOGS[key] = (stamp, data)
+    return data
+
+
+_Method = TypeVar('_Method', bound=Callable[..., Any])
+
+
+def _indexed(method: _Method) -> _Method:
+    """Rebuild the analyzer's derived tables before a query if the catalog changed."""
+    @functools.wraps(method)
+    def wrapper(self: "CloudCostAnalyzer", *args: Any, **kwargs: Any) -> Any:
+        if self._stale:
+            self.ensure_indexes()
+        return method(self, *args, **kwargs)
+    return wrapper  # type: ignore[return-value]
 
 
 class CloudCostAnalyzer:
@@ -18,11 +94,22 @@ class CloudCostAnalyzer:
             data_path: Path to cloud instances JSON file
         """
         if data_path is None:
-            # Default to data/cloud/instances.json
-            data_path = Path(__file__).parent.parent.parent / "data" / "cloud" / "instances.json"
+            data_path = _DEFAULT_DATA_PATH
 
         self.data_path = data_path
         self.instances: List[CloudInstance] = []
+        self._type_rows: Dict[str, int] = {}
+        self._provider_slices: Dict[str, slice] = {}
+        self._gpu_rows: Dict[str, List[int]] = {}
+        self._training_instances: Tuple[CloudInstance, ...] = ()
+        self._inference_instances: Tuple[CloudInstance, ...] = ()
+        self._default_training: Optional[CloudInstance] = None
+        self._default_training_error = ""
+        self._records: Optional[List[Dict[str, Any]]] = None
+        # Derived tables are built on the first query after a (re)load; the lock
+        # keeps concurrent first queries from rebuilding them at the same time
+        self._stale = True
+        self._index_lock = threading.Lock()
         self.load_data()
 
     def load_data(self) -> None:
@@ -34,8 +121,8 @@ class CloudCostAnalyzer:
             ValueError: If instance data is invalid
         """
         try:
-            with open(self.data_path, 'r') as f:
-                data = json.load(f)
+            # Records are only read below, so repeat constructions can share one parse
+            data = _read_catalog(self.data_path)
         except FileNotFoundError:
             raise FileNotFoundError(
                 f"Cloud instance data file not found: {self.data_path}. "
@@ -54,13 +141,20 @@ class CloudCostAnalyzer:
         if not data:
             raise ValueError("Cloud instance data file is empty")
 
-        self.instances = []
+        instances = []
         errors = []
 
+        row_of = itemgetter(*CLOUD_INSTANCE_FIELDS)
+        all_fields = frozenset(CLOUD_INSTANCE_FIELDS)
+
         for idx, item in enumerate(data):
             try:
-                instance = CloudInstance(**item)
-                self.instances.append(instance)
+                # Complete records are built positionally; partial ones need defaults
+                if item.keys() == all_fields:
+                    instance = CloudInstance.from_tuple(row_of(item))
+                else:
+                    instance = CloudInstance(**item)
+                instances.append(instance)
             except (TypeError, ValueError) as e:
                 errors.append(f"Instance {idx} ({item.get('instance_type', 'unknown')}): {str(e)}")
 
@@ -68,35 +162,165 @@ class CloudCostAnalyzer:
             error_msg = "Errors loading cloud instances:\n" + "\n".join(errors)
             raise ValueError(error_msg)
 
-        if not self.instances:
+        if not instances:
             raise ValueError("No valid instances loaded from data file")
 
-        # Sort by provider, then by price
-        self.instances.sort(key=lambda x: (x.provider, x.price_ondemand_hourly))
+        # Sort by provider, then by price; the case-folded key keeps each provider contiguous.
+        # The finished list replaces the old one so readers never see it half-filled
+        instances.sort(key=_catalog_order)
+        with self._index_lock:
+            self.instances = instances
+            self._stale = True
+
+    def invalidate_caches(self) -> None:
+        """Mark derived tables out of date after editing self.instances directly."""
+        self._stale = True
+
+    def ensure_indexes(self) -> None:
+        """Build the derived tables now if the catalog changed since they were last built.
+
+        Queries do this on first use; call it up front to keep the rebuild
+        on the calling thread. Safe to call from several threads at once.
+        """
+        with self._index_lock:
+            if self._stale:
+                self._build_indexes()
+
+    def _build_indexes(self) -> None:
+        """Sort the catalog and rebuild every table derived from it.
+
+        Everything is built from a sorted copy of self.instances and swapped in
+        with one attribute update, so concurrent readers see either the old
+        catalog and tables or the new ones. Callers hold _index_lock.
+        """
+        # Direct edits may have broken the load order (a no-op pass after load_data)
+        instances = sorted(self.instances, key=_catalog_order)
+        tables = self._build_columns(instances)
+
+        # Case-insensitive lookup indexes; buckets keep the sorted dataset order
+        # and for instance types the first match wins
+        type_rows: Dict[str, int] = {}
+        gpu_rows: Dict[str, List[int]] = {}
+        for row, instance in enumerate(instances):
+            type_rows.setdefault(instance.instance_type.lower(), row)
+            gpu_rows.setdefault(instance.gpu_model.lower(), []).append(row)
+
+        # The default training instance depends only on the catalog, so choose it now
+        # and keep the reason if there is none to report from estimate_llm_training_cost
+        try:
+            default_training = self._pick_default_training_instance(instances, tables)
+            default_training_error = ""
+        except ValueError as e:
+            default_training = None
+            default_training_error = str(e)
+
+        tables.update(
+            instances=instances,
+            _type_rows=type_rows,
+            _gpu_rows=gpu_rows,
+            # Workload subsets in dataset order
+            _training_instances=tuple(i for i in instances if i.training_optimized),
+            _inference_instances=tuple(i for i in instances if i.inference_optimized),
+            _default_training=default_training,
+            _default_training_error=default_training_error,
+            _records=None,
+        )
+        self.__dict__.update(tables)
+        self._stale = False
+
+    def _build_columns(self, instances: List[CloudInstance]) -> Dict[str, Any]:
+        """Build column arrays aligned with instances for vectorized queries.
+
+        Returns:
+            Attribute name -> array, for _build_indexes to install
+        """
+        # Transpose the catalog in one C-level pass instead of one comprehension per field
+        (providers, gpu_models, price_od, price_spot, gpu_count, tflops_fp32, tflops_fp16,
+         years, training, inference, ml) = tuple(zip(*map(_COLUMN_FIELDS, instances))) or ((),) * 11
+
+        # Filled here and installed on self by _build_indexes in one update
+        cols = SimpleNamespace()
+
+        cols._provider_arr = np.array(providers, dtype=str)
+        cols._provider_lower = np.char.lower(cols._provider_arr)
+        # Rows are sorted by lowercase provider, so each provider is one contiguous slice
+        names, starts, codes, counts = np.unique(
+            cols._provider_lower, return_index=True, return_inverse=True, return_counts=True
+        )
+        cols._provider_slices = {
+            str(name): slice(int(start), int(start + count))
+            for name, start, count in zip(names, starts, counts)
+        }
+        # Group code per row and first row per group, for bincount/reduceat groupbys
+        cols._provider_codes = codes.reshape(-1)
+        cols._provider_starts = starts
+        cols._gpu_model_arr = np.array(gpu_models, dtype=str)
+        cols._has_gpu_model = cols._gpu_model_arr != ''
+        # Sorted distinct names, shared by the statistics methods
+        cols._unique_providers = np.unique(cols._provider_arr).tolist()
+        cols._unique_gpus = np.unique(cols._gpu_model_arr[cols._has_gpu_model]).tolist()
+        cols._price_od = np.array(price_od, dtype=np.float64)
+        cols._price_spot = np.array(price_spot, dtype=np.float64)
+        cols._gpu_count = np.array(gpu_count, dtype=np.int64)
+        cols._tflops_fp32 = np.array(tflops_fp32, dtype=np.float64)
+        cols._tflops_fp16 = np.array(tflops_fp16, dtype=np.float64)
+        cols._year = np.array(years, dtype=np.int64)
+        cols._training_mask = np.array(training, dtype=bool)
+        cols._inference_mask = np.array(inference, dtype=bool)
+        cols._ml_mask = np.array(ml, dtype=bool)
+
+        # Matches compute_cost_metrics(): NaN where tflops_per_dollar is undefined
+        priced = (cols._tflops_fp32 > 0) & (cols._price_od > 0)
+        cols._tflops_per_dollar = np.divide(
+            cols._tflops_fp32, cols._price_od,
+            out=np.full_like(cols._price_od, np.nan), where=priced
+        )
+        cols._cost_per_gpu_hour = np.divide(
+            cols._price_od, cols._gpu_count,
+            out=np.full_like(cols._price_od, np.nan), where=(cols._gpu_count > 0) & (cols._price_od > 0)
+        )
+        cols._cost_per_tflop_hour = np.divide(
+            cols._price_od, cols._tflops_fp32,
+            out=np.full_like(cols._price_od, np.nan), where=priced
+        )
+
+        # Same for spot_discount_percent, defined when both prices are set
+        cols._spot_priced = (cols._price_spot > 0) & (cols._price_od > 0)
+        cols._spot_discount = np.full_like(cols._price_od, np.nan)
+        cols._spot_discount[cols._spot_priced] = (
+            1 - cols._price_spot[cols._spot_priced] / cols._price_od[cols._spot_priced]
+        ) * 100
+        return vars(cols)
 
+    @_indexed
     def get_instances_by_provider(self, provider: str) -> List[CloudInstance]:
         """Get all instances from a specific provider."""
-        return [i for i in self.instances if i.provider.lower() == provider.lower()]
+        span = self._provider_slices.get(provider.lower())
+        return self.instances[span] if span else []
 
+    @_indexed
     def get_instance_by_type(self, instance_type: str) -> Optional[CloudInstance]:
         """Get a specific instance by type name."""
-        for instance in self.instances:
-            if instance.instance_type.lower() == instance_type.lower():
-                return instance
-        return None
+        row = self._type_rows.get(instance_type.lower())
+        return None if row is None else self.instances[row]
 
+    @_indexed
     def get_instances_by_gpu_model(self, gpu_model: str) -> List[CloudInstance]:
         """Get all instances with a specific GPU model."""
-        return [i for i in self.instances if i.gpu_model.lower() == gpu_model.lower()]
+        instances = self.instances
+        return [instances[row] for row in self._gpu_rows.get(gpu_model.lower(), ())]
 
+    @_indexed
     def get_training_instances(self) -> List[CloudInstance]:
         """Get instances optimized for training."""
-        return [i for i in self.instances if i.training_optimized]
+        return list(self._training_instances)
 
+    @_indexed
     def get_inference_instances(self) -> List[CloudInstance]:
         """Get instances optimized for inference."""
-        return [i for i in self.instances if i.inference_optimized]
+        return list(self._inference_instances)
 
+    @_indexed
     def compare_providers_for_training(
         self,
         training_hours: float,
@@ -120,43 +344,37 @@ class CloudCostAnalyzer:
         providers = ['AWS', 'Azure', 'GCP']
         comparison = {}
 
-        for provider in providers:
-            provider_instances = self.get_instances_by_provider(provider)
-            training_capable = [i for i in provider_instances if i.training_optimized]
+        # Instances that can be priced this way; the rest would raise in calculate_training_cost
+        rates = self._price_spot if use_spot else self._price_od
+        priced = self._training_mask & (rates > 0)
+        costs = training_hours * rates
 
-            if not training_capable:
+        for provider in providers:
+            span = self._provider_slices.get(provider.lower())
+            candidates = span.start + np.flatnonzero(priced[span]) if span else ()
+            if not len(candidates):
                 continue
 
-            # Find most cost-effective instance
-            best_instance = None
-            best_cost = float('inf')
-
-            for instance in training_capable:
-                try:
-                    cost_calc = instance.calculate_training_cost(
-                        training_hours=training_hours,
-                        use_spot=use_spot
-                    )
-                    if cost_calc['total_cost_usd'] < best_cost:
-                        best_cost = cost_calc['total_cost_usd']
-                        best_instance = instance
-                except ValueError:
-                    # Skip instances that don't support requested pricing model
-                    continue
-
-            if best_instance:
-                comparison[provider] = {
-                    'instance_type': best_instance.instance_type,
-                    'gpu_model': best_instance.gpu_model,
-                    'gpu_count': best_instance.gpu_count,
-                    'total_tflops_fp32': best_instance.tflops_fp32,
-                    'total_cost_usd': best_cost,
-                    'hourly_rate': best_instance.price_spot_hourly if use_spot else best_instance.price_ondemand_hourly,
-                    'cost_per_tflop_hour': best_cost / training_hours / best_instance.tflops_fp32 if best_instance.tflops_fp32 > 0 else 0,
-                }
+            # argmin keeps the first of equal costs, like the strict < scan it replaces
+            best_instance = self.instances[candidates[np.argmin(costs[candidates])]]
+            best_cost = best_instance.calculate_training_cost(
+                training_hours=training_hours,
+                use_spot=use_spot
+            )['total_cost_usd']
+
+            comparison[provider] = {
+                'instance_type': best_instance.instance_type,
+                'gpu_model': best_instance.gpu_model,
+                'gpu_count': best_instance.gpu_count,
+                'total_tflops_fp32': best_instance.tflops_fp32,
+                'total_cost_usd': best_cost,
+                'hourly_rate': best_instance.price_spot_hourly if use_spot else best_instance.price_ondemand_hourly,
+                'cost_per_tflop_hour': best_cost / training_hours / best_instance.tflops_fp32 if best_instance.tflops_fp32 > 0 else 0,
+            }
 
         return comparison
 
+    @_indexed
     def compare_providers_for_inference(
         self,
         requests_per_second: float,
@@ -190,59 +408,69 @@ class CloudCostAnalyzer:
         providers = ['AWS', 'Azure', 'GCP']
         comparison = {}
 
-        for provider in providers:
-            provider_instances = self.get_instances_by_provider(provider)
-            inference_capable = [i for i in provider_instances if i.inference_optimized or i.ml_optimized]
+        # Same formula as calculate_inference_cost, over every instance it would accept
+        priced = (self._inference_mask | self._ml_mask) & (self._gpu_count > 0) & (self._price_od > 0)
+        gpus_needed = requests_per_second * avg_tokens_per_request / tokens_per_second_per_gpu
+        with np.errstate(divide='ignore', invalid='ignore'):
+            instances_needed = np.maximum(1, np.ceil(gpus_needed / self._gpu_count))
+        costs = instances_needed * self._price_od * (24 * days)
 
-            if not inference_capable:
+        for provider in providers:
+            span = self._provider_slices.get(provider.lower())
+            candidates = span.start + np.flatnonzero(priced[span]) if span else ()
+            if not len(candidates):
                 continue
 
-            # Find most cost-effective instance
-            best_instance = None
-            best_cost = float('inf')
-            best_calc = None
-
-            for instance in inference_capable:
-                try:
-                    cost_calc = instance.calculate_inference_cost(
-                        requests_per_second=requests_per_second,
-                        avg_tokens_per_request=avg_tokens_per_request,
-                        tokens_per_second_per_gpu=tokens_per_second_per_gpu,
-                        days=days
-                    )
-                    if cost_calc['compute_cost_usd'] < best_cost:
-                        best_cost = cost_calc['compute_cost_usd']
-                        best_instance = instance
-                        best_calc = cost_calc
-                except ValueError:
-                    # Skip instances with invalid configurations
-                    continue
-
-            if best_instance and best_calc:
-                comparison[provider] = {
-                    'instance_type': best_instance.instance_type,
-                    'gpu_model': best_instance.gpu_model,
-                    'gpu_count': best_instance.gpu_count,
-                    'total_cost_usd': best_calc['compute_cost_usd'],
-                    'instances_needed': best_calc['instances_needed'],
-                    'cost_per_1k_requests': best_calc['cost_per_1k_requests'],
-                    'cost_per_1m_tokens': best_calc['cost_per_1m_tokens'],
-                }
+            # argmin keeps the first of equal costs, like the strict < scan it replaces
+            best_instance = self.instances[candidates[np.argmin(costs[candidates])]]
+            best_calc = best_instance.calculate_inference_cost(
+                requests_per_second=requests_per_second,
+                avg_tokens_per_request=avg_tokens_per_request,
+                tokens_per_second_per_gpu=tokens_per_second_per_gpu,
+                days=days
+            )
+
+            comparison[provider] = {
+                'instance_type': best_instance.instance_type,
+                'gpu_model': best_instance.gpu_model,
+                'gpu_count': best_instance.gpu_count,
+                'total_cost_usd': best_calc['compute_cost_usd'],
+                'instances_needed': best_calc['instances_needed'],
+                'cost_per_1k_requests': best_calc['cost_per_1k_requests'],
+                'cost_per_1m_tokens': best_calc['cost_per_1m_tokens'],
+            }
 
         return comparison
 
     def get_cost_efficiency_ranking(
         self,
-        workload_type: str = 'training'
+        workload_type: str = 'training',
+        top_k: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """Rank instances by cost efficiency.
 
         Args:
             workload_type: 'training' or 'inference'
+            top_k: Only return the k most efficient instances (all if None)
 
         Returns:
             List of instances ranked by cost efficiency
 
+        Raises:
+            ValueError: If workload_type is invalid
+        """
+        return list(self.iter_cost_efficiency_ranking(workload_type, top_k))
+
+    @_indexed
+    def iter_cost_efficiency_ranking(
+        self,
+        workload_type: str = 'training',
+        top_k: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Lazily yield instances ranked by cost efficiency.
+
+        The ranking is computed up front; each row dict is built as it is consumed.
+
         Raises:
             ValueError: If workload_type is invalid
         """
@@ -253,61 +481,96 @@ class CloudCostAnalyzer:
                 f"Must be one of: {valid_workload_types}"
             )
 
-        if workload_type == 'training':
-            candidates = self.get_training_instances()
-        else:
-            candidates = self.get_inference_instances()
-
-        if not candidates:
-            return []  # Return empty list if no instances match criteria
+        mask = self._training_mask if workload_type == 'training' else self._inference_mask
+        ranked = np.flatnonzero(mask & ~np.isnan(self._tflops_per_dollar))
 
-        ranking = []
-        for instance in candidates:
-            metrics = instance.compute_cost_metrics()
-            if 'tflops_per_dollar' in metrics:
-                ranking.append({
-                    'provider': instance.provider,
-                    'instance_type': instance.instance_type,
-                    'gpu_model': instance.gpu_model,
-                    'gpu_count': instance.gpu_count,
-                    'tflops_per_dollar': metrics['tflops_per_dollar'],
-                    'cost_per_tflop_hour': metrics.get('cost_per_tflop_hour', 0),
-                    'price_ondemand_hourly': instance.price_ondemand_hourly,
-                    'price_spot_hourly': instance.price_spot_hourly,
-                })
+        return (self._ranking_entry(i) for i in _rank_rows(ranked, self._tflops_per_dollar, top_k))
 
-        # Sort by TFLOPS per dollar (descending)
-        ranking.sort(key=lambda x: x['tflops_per_dollar'], reverse=True)
-        return ranking
+    def _ranking_entry(self, row: int) -> Dict[str, Any]:
+        """Cost efficiency row for one ranked (priced) instance."""
+        instance = self.instances[row]
+        return {
+            'provider': instance.provider,
+            'instance_type': instance.instance_type,
+            'gpu_model': instance.gpu_model,
+            'gpu_count': instance.gpu_count,
+            'tflops_per_dollar': float(self._tflops_per_dollar[row]),
+            'cost_per_tflop_hour': float(self._cost_per_tflop_hour[row]),
+            'price_ondemand_hourly': instance.price_ondemand_hourly,
+            'price_spot_hourly': instance.price_spot_hourly,
+        }
 
-    def get_spot_savings_analysis(self) -> List[Dict[str, Any]]:
+    def get_spot_savings_analysis(self, top_k: Optional[int] = None) -> List[Dict[str, Any]]:
         """Analyze potential savings from spot instances.
 
+        Args:
+            top_k: Only return the k largest discounts (all if None)
+
         Returns:
             List of instances with spot savings data
         """
-        analysis = []
-        for instance in self.instances:
-            if instance.price_spot_hourly > 0 and instance.price_ondemand_hourly > 0:
-                metrics = instance.compute_cost_metrics()
-                savings_percent = metrics.get('spot_discount_percent', 0)
-                annual_savings = (instance.price_ondemand_hourly - instance.price_spot_hourly) * 24 * 365
-
-                analysis.append({
-                    'provider': instance.provider,
-                    'instance_type': instance.instance_type,
-                    'gpu_model': instance.gpu_model,
-                    'gpu_count': instance.gpu_count,
-                    'ondemand_hourly': instance.price_ondemand_hourly,
-                    'spot_hourly': instance.price_spot_hourly,
-                    'savings_percent': savings_percent,
-                    'annual_savings_usd': annual_savings,
-                })
+        return list(self.iter_spot_savings_analysis(top_k))
+
+    @_indexed
+    def iter_spot_savings_analysis(self, top_k: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Lazily yield spot savings rows, largest discount first.
+
+        The order is computed up front; each row dict is built as it is consumed.
+        """
+        rows = np.flatnonzero(self._spot_priced)
+        annual_savings = (self._price_od - self._price_spot) * 24 * 365
 
         # Sort by savings percentage
-        analysis.sort(key=lambda x: x['savings_percent'], reverse=True)
-        return analysis
+        order = _rank_rows(rows, self._spot_discount, top_k)
+
+        instances = self.instances
+        return (
+            {
+                'provider': instances[i].provider,
+                'instance_type': instances[i].instance_type,
+                'gpu_model': instances[i].gpu_model,
+                'gpu_count': instances[i].gpu_count,
+                'ondemand_hourly': instances[i].price_ondemand_hourly,
+                'spot_hourly': instances[i].price_spot_hourly,
+                'savings_percent': float(self._spot_discount[i]),
+                'annual_savings_usd': float(annual_savings[i]),
+            }
+            for i in order
+        )
+
+    def _pick_default_training_instance(
+        self, instances: List[CloudInstance], tables: Dict[str, Any]
+    ) -> CloudInstance:
+        """Best training instance for estimates that don't name one.
+
+        Args:
+            instances: Sorted catalog being indexed
+            tables: Column arrays built from instances by _build_columns
+
+        Raises:
+            ValueError: If no suitable training instance exists
+        """
+        training_mask = tables['_training_mask']
+        gpu_models = tables['_gpu_model_arr']
+        tflops_fp16 = tables['_tflops_fp16']
+        if not training_mask.any():
+            raise ValueError("No training-optimized instances found in dataset")
+
+        # Prefer H100 instances, then A100, then any instance with FP16 performance
+        tiers = (
+            training_mask & (np.char.find(gpu_models, 'H100') >= 0),
+            training_mask & (np.char.find(gpu_models, 'A100') >= 0),
+            training_mask & (tflops_fp16 > 0),
+        )
+        candidates = next((np.flatnonzero(tier) for tier in tiers if tier.any()), None)
+        if candidates is None:
+            raise ValueError("No instances with FP16 TFLOPS data available")
+
+        # Highest FP16 throughput means the fewest training hours
+        best = candidates[np.argmax(np.clip(tflops_fp16[candidates], 0, None))]
+        return instances[best]
 
+    @_indexed
     def estimate_llm_training_cost(
         self,
         parameters_billions: float,
@@ -353,25 +616,9 @@ class CloudCostAnalyzer:
                 raise ValueError(f"Instance type '{instance_type}' not found in dataset")
         else:
             # Use best training instance (A100 or H100)
-            training_instances = self.get_training_instances()
-
-            if not training_instances:
-                raise ValueError("No training-optimized instances found in dataset")
-
-            # Prefer H100 instances
-            h100_instances = [i for i in training_instances if 'H100' in i.gpu_model]
-            if h100_instances:
-                instance = max(h100_instances, key=lambda x: x.tflops_fp16 if x.tflops_fp16 > 0 else 0)
-            else:
-                a100_instances = [i for i in training_instances if 'A100' in i.gpu_model]
-                if a100_instances:
-                    instance = max(a100_instances, key=lambda x: x.tflops_fp16 if x.tflops_fp16 > 0 else 0)
-                else:
-                    # Fallback to any instance with FP16 performance
-                    instances_with_fp16 = [i for i in training_instances if i.tflops_fp16 > 0]
-                    if not instances_with_fp16:
-                        raise ValueError("No instances with FP16 TFLOPS data available")
-                    instance = max(instances_with_fp16, key=lambda x: x.tflops_fp16)
+            instance = self._default_training
+            if instance is None:
+                raise ValueError(self._default_training_error)
 
         # Validate instance has FP16 performance data
         if instance.tflops_fp16 <= 0:
@@ -411,79 +658,97 @@ class CloudCostAnalyzer:
             **cost_result
         }
 
+    @_indexed
     def get_gpu_price_evolution(self) -> Dict[str, List[Dict[str, Any]]]:
         """Get price evolution for different GPU models.
 
         Returns:
             Dictionary mapping GPU models to price data over time
         """
-        gpu_models = set(i.gpu_model for i in self.instances if i.gpu_model)
         evolution = {}
 
-        for gpu_model in gpu_models:
-            instances = self.get_instances_by_gpu_model(gpu_model)
-            price_data = []
+        instances = self.instances
 
-            for instance in instances:
-                metrics = instance.compute_cost_metrics()
-                price_data.append({
-                    'year': instance.year,
-                    'provider': instance.provider,
-                    'instance_type': instance.instance_type,
-                    'price_ondemand_hourly': instance.price_ondemand_hourly,
-                    'cost_per_gpu_hour': metrics.get('cost_per_gpu_hour', 0),
-                    'tflops_per_dollar': metrics.get('tflops_per_dollar', 0),
-                })
+        # One pass over the GPU model index; buckets already hold every spelling of a model
+        for bucket_key, rows in self._gpu_rows.items():
+            if not bucket_key:
+                continue
+
+            # Sort by year; stable, so equal years keep dataset order
+            bucket = np.asarray(rows)
+            bucket = bucket[np.argsort(self._year[bucket], kind='stable')]
+            cost_per_gpu = self._cost_per_gpu_hour[bucket].tolist()
+            tflops_per_dollar = self._tflops_per_dollar[bucket].tolist()
+
+            price_data = [
+                {
+                    'year': instances[row].year,
+                    'provider': instances[row].provider,
+                    'instance_type': instances[row].instance_type,
+                    'price_ondemand_hourly': instances[row].price_ondemand_hourly,
+                    'cost_per_gpu_hour': _or_zero(cost),
+                    'tflops_per_dollar': _or_zero(tpd),
+                }
+                for row, cost, tpd in zip(bucket.tolist(), cost_per_gpu, tflops_per_dollar)
+            ]
 
-            # Sort by year
-            price_data.sort(key=lambda x: x['year'])
-            evolution[gpu_model] = price_data
+            for gpu_model in dict.fromkeys(instances[row].gpu_model for row in rows):
+                evolution[gpu_model] = list(price_data)
 
         return evolution
 
+    @_indexed
     def get_provider_statistics(self) -> Dict[str, Dict[str, Any]]:
         """Get summary statistics per provider.
 
         Returns:
             Dictionary with statistics for each provider
         """
-        providers = set(i.provider for i in self.instances)
-        stats = {}
-
-        for provider in providers:
-            provider_instances = self.get_instances_by_provider(provider)
-
-            if not provider_instances:
-                continue
-
-            # Calculate averages
-            avg_price = sum(i.price_ondemand_hourly for i in provider_instances) / len(provider_instances)
-            avg_spot_discount = sum(
-                i.compute_cost_metrics().get('spot_discount_percent', 0)
-                for i in provider_instances
-                if i.price_spot_hourly > 0
-            ) / max(1, sum(1 for i in provider_instances if i.price_spot_hourly > 0))
+        codes = self._provider_codes
+        groups = len(self._provider_starts)
+        has_spot = self._price_spot > 0
+        # Discount counts as 0 for instances with a spot price but no on-demand price
+        discount = np.where(self._spot_priced, self._spot_discount, 0.0)
+
+        # One vectorized reduction per column, grouped by provider
+        counts = np.bincount(codes, minlength=groups)
+        price_sums = np.bincount(codes, weights=self._price_od, minlength=groups)
+        gpu_sums = np.bincount(codes, weights=self._gpu_count, minlength=groups)
+        spot_counts = np.bincount(codes, weights=has_spot, minlength=groups)
+        discount_sums = np.bincount(codes, weights=np.where(has_spot, discount, 0.0), minlength=groups)
+        training_counts = np.bincount(codes, weights=self._training_mask, minlength=groups)
+        inference_counts = np.bincount(codes, weights=self._inference_mask, minlength=groups)
+        if groups:
+            price_mins = np.minimum.reduceat(self._price_od, self._provider_starts)
+            price_maxs = np.maximum.reduceat(self._price_od, self._provider_starts)
 
-            total_gpus = sum(i.gpu_count for i in provider_instances)
-            gpu_models = set(i.gpu_model for i in provider_instances if i.gpu_model)
+        stats = {}
+        for provider in self._unique_providers:
+            # Providers match case-insensitively; each one is a contiguous run of rows
+            span = self._provider_slices[provider.lower()]
+            k = codes[span.start]
+            gpu_models = np.unique(self._gpu_model_arr[span][self._has_gpu_model[span]]).tolist()
 
             stats[provider] = {
-                'instance_count': len(provider_instances),
-                'avg_hourly_cost': avg_price,
-                'avg_spot_discount_percent': avg_spot_discount,
-                'total_gpus': total_gpus,
+                'instance_count': int(counts[k]),
+                'avg_hourly_cost': float(price_sums[k] / counts[k]),
+                'avg_spot_discount_percent': (
+                    float(discount_sums[k] / spot_counts[k]) if spot_counts[k] else 0.0
+                ),
+                'total_gpus': int(gpu_sums[k]),
                 'unique_gpu_models': len(gpu_models),
-                'gpu_models': sorted(list(gpu_models)),
-                'training_instances': sum(1 for i in provider_instances if i.training_optimized),
-                'inference_instances': sum(1 for i in provider_instances if i.inference_optimized),
+                'gpu_models': gpu_models,
+                'training_instances': int(training_counts[k]),
+                'inference_instances': int(inference_counts[k]),
                 'price_range': {
-                    'min': min(i.price_ondemand_hourly for i in provider_instances),
-                    'max': max(i.price_ondemand_hourly for i in provider_instances),
+                    'min': float(price_mins[k]),
+                    'max': float(price_maxs[k]),
                 }
             }
 
         return stats
 
+    @_indexed
     def compare_instance_specs(
         self,
         instance_types: List[str]
@@ -497,11 +762,13 @@ class CloudCostAnalyzer:
             List of instance specs for comparison
         """
         comparison = []
+        instances = self.instances
+        lookup = self._type_rows.get  # bound once; keys are lowercased per entry below
 
         for instance_type in instance_types:
-            instance = self.get_instance_by_type(instance_type)
-            if instance:
-                metrics = instance.compute_cost_metrics()
+            row = lookup(instance_type.lower())
+            if row is not None:
+                instance = instances[row]
                 comparison.append({
                     'provider': instance.provider,
                     'instance_type': instance.instance_type,
@@ -515,39 +782,47 @@ class CloudCostAnalyzer:
                     'tflops_fp16': instance.tflops_fp16,
                     'price_ondemand_hourly': instance.price_ondemand_hourly,
                     'price_spot_hourly': instance.price_spot_hourly,
-                    'tflops_per_dollar': metrics.get('tflops_per_dollar', 0),
-                    'cost_per_gpu_hour': metrics.get('cost_per_gpu_hour', 0),
+                    'tflops_per_dollar': _or_zero(float(self._tflops_per_dollar[row])),
+                    'cost_per_gpu_hour': _or_zero(float(self._cost_per_gpu_hour[row])),
                 })
 
         return comparison
 
+    @_indexed
     def get_summary_statistics(self) -> Dict[str, Any]:
         """Get summary statistics for all cloud instances."""
         if not self.instances:
             return {}
 
-        providers = set(i.provider for i in self.instances)
-        gpu_models = set(i.gpu_model for i in self.instances if i.gpu_model)
-
-        total_training = sum(1 for i in self.instances if i.training_optimized)
-        total_inference = sum(1 for i in self.instances if i.inference_optimized)
+        providers = list(self._unique_providers)
+        gpu_models = list(self._unique_gpus)
 
         return {
             'total_instances': len(self.instances),
-            'providers': list(providers),
+            'providers': providers,
             'provider_count': len(providers),
-            'gpu_models': sorted(list(gpu_models)),
+            'gpu_models': gpu_models,
             'unique_gpu_models': len(gpu_models),
-            'training_instances': total_training,
-            'inference_instances': total_inference,
+            'training_instances': int(np.count_nonzero(self._training_mask)),
+            'inference_instances': int(np.count_nonzero(self._inference_mask)),
             'price_range': {
-                'min': min(i.price_ondemand_hourly for i in self.instances),
-                'max': max(i.price_ondemand_hourly for i in self.instances),
-                'avg': sum(i.price_ondemand_hourly for i in self.instances) / len(self.instances)
+                'min': float(self._price_od.min()),
+                'max': float(self._price_od.max()),
+                'avg': float(self._price_od.mean())
             },
-            'year_range': f"{min(i.year for i in self.instances)}-{max(i.year for i in self.instances)}"
+            'year_range': f"{self._year.min()}-{self._year.max()}"
         }
 
     def to_dict(self) -> List[Dict[str, Any]]:
-        """Convert all instances to dictionaries."""
-        return [instance.to_dict() for instance in self.instances]
+        """Convert all instances to dictionaries.
+
+        The records are built once per load; callers get fresh copies.
+        """
+        return list(self.iter_dicts())
+
+    @_indexed
+    def iter_dicts(self) -> Iterator[Dict[str, Any]]:
+        """Lazily yield a fresh dictionary per instance, in catalog order."""
+        if self._records is None:
+            self._records = [instance.to_dict() for instance in self.instances]
+        return (dict(record) for record in self._records)
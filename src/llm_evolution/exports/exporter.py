@@ -1,14 +1,75 @@
 """Data export functionality for various formats."""
 
-import json
+import io
 import csv
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, NamedTuple, Optional, Tuple
 from datetime import datetime
 
 import pandas as pd
 from tabulate import tabulate
 
+from ..utils import write_json
+
+
+_TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Section underline in text reports
+_RULE = "-" * 80
+
+
+def _timestamp() -> str:
+    """Current local time formatted for report headers."""
+    return datetime.now().strftime(_TIMESTAMP_FORMAT)
+
+
+def _markdown_table(rows: List[Dict[str, Any]]) -> str:
+    """Render rows as a pipe table, same as pd.DataFrame(rows).to_markdown(index=False).
+
+    Rows sharing one set of keys and holding only str, int and float cells go
+    straight to tabulate. Anything else (missing keys, None, bools, nested
+    values) goes through pandas, whose dtype coercion the output depends on.
+    """
+    keys = rows[0].keys() if isinstance(rows[0], dict) else None
+    if keys is not None and all(isinstance(row, dict) and row.keys() == keys for row in rows):
+        cell_types = {type(value) for row in rows for value in row.values()}
+        # An all-numeric frame with any float column upcasts its int columns too
+        if cell_types <= {str, int, float} and (str in cell_types or float not in cell_types):
+            return tabulate(rows, headers="keys", tablefmt="pipe")
+    return pd.DataFrame(rows).to_markdown(index=False)
+
+
+# Keys of analysis_data with their own report section; any other key becomes an extra section
+_REPORT_SECTIONS = ("title", "summary", "cagr", "data", "date_range")
+
+
+class _ReportContext(NamedTuple):
+    """Format-independent parts of an analysis report, prepared once for every writer."""
+
+    generated_at: str
+    cagr_rows: List[Dict[str, Any]]
+    extra_sections: List[Tuple[str, Any]]
+
+
+def _prepare_report(analysis_data: Dict[str, Any], generated_at: Optional[str] = None) -> _ReportContext:
+    """Normalize the parts of analysis_data that every report format renders the same way."""
+    cagr_rows = []
+    cagr_data = analysis_data.get("cagr")
+    if isinstance(cagr_data, dict):
+        for result in cagr_data.values():
+            if hasattr(result, 'to_dict'):
+                cagr_rows.append(result.to_dict())
+            elif isinstance(result, dict):
+                cagr_rows.append(result)
+
+    return _ReportContext(
+        generated_at=generated_at or _timestamp(),
+        cagr_rows=cagr_rows,
+        extra_sections=[
+            (key, value) for key, value in analysis_data.items() if key not in _REPORT_SECTIONS
+        ],
+    )
+
 
 class Exporter:
     """Exporter for analysis results in multiple formats."""
@@ -42,13 +103,7 @@ class Exporter:
             Path to exported file
         """
         output_path = self.output_dir / filename
-
-        with open(output_path, 'w') as f:
-            if pretty:
-                json.dump(data, f, indent=2, default=str)
-            else:
-                json.dump(data, f, default=str)
-
+        write_json(output_path, data, pretty=pretty)
         return output_path
 
     def export_csv(
@@ -70,17 +125,21 @@ class Exporter:
 
         output_path = self.output_dir / filename
 
-        # Get all unique keys
-        keys = set()
-        for item in data:
-            keys.update(item.keys())
+        # Get all unique keys; rows normally share the first row's schema, so only
+        # rows whose key set differs (one C-level view comparison each) are merged
+        first_keys = data[0].keys()
+        extra_keys = {key for item in data if item.keys() != first_keys for key in item}
+        keys = sorted(first_keys | extra_keys)
 
-        keys = sorted(keys)
+        # Build the file in memory and write it once; a plain writer over the
+        # fixed key order skips DictWriter's per-row field checks
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(keys)
+        writer.writerows([item.get(key, '') for key in keys] for item in data)
 
         with open(output_path, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=keys)
-            writer.writeheader()
-            writer.writerows(data)
+            f.write(buffer.getvalue())
 
         return output_path
 
@@ -89,6 +148,7 @@ class Exporter:
         data: List[Dict[str, Any]],
         filename: str,
         title: Optional[str] = None,
+        generated_at: Optional[str] = None,
     ) -> Path:
         """Export data to Markdown format.
 
@@ -96,24 +156,25 @@ class Exporter:
             data: List of dictionaries to export
             filename: Output filename
             title: Optional title for the document
+            generated_at: Timestamp to print (defaults to now)
 
         Returns:
             Path to exported file
         """
         output_path = self.output_dir / filename
 
-        with open(output_path, 'w') as f:
-            if title:
-                f.write(f"# {title}\n\n")
+        # Render every block first, then hand them to the file in one call
+        chunks = []
+        if title:
+            chunks.append(f"# {title}\n\n")
 
-            f.write(f"*Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n\n")
+        chunks.append(f"*Generated on {generated_at or _timestamp()}*\n\n")
 
-            if data:
-                # Convert to DataFrame for better table formatting
-                df = pd.DataFrame(data)
-                markdown_table = df.to_markdown(index=False)
-                f.write(markdown_table)
-                f.write("\n\n")
+        if data:
+            chunks += [_markdown_table(data), "\n\n"]
+
+        with open(output_path, 'w') as f:
+            f.writelines(chunks)
 
         return output_path
 
@@ -123,6 +184,7 @@ class Exporter:
         filename: str,
         title: Optional[str] = None,
         table_format: str = "grid",
+        generated_at: Optional[str] = None,
     ) -> Path:
         """Export data to plain text format.
 
@@ -131,24 +193,27 @@ class Exporter:
             filename: Output filename
             title: Optional title for the document
             table_format: Table format for tabulate (grid, plain, simple, etc.)
+            generated_at: Timestamp to print (defaults to now)
 
         Returns:
             Path to exported file
         """
         output_path = self.output_dir / filename
 
-        with open(output_path, 'w') as f:
-            if title:
-                f.write(f"{title}\n")
-                f.write("=" * len(title) + "\n\n")
+        # Render every block first, then hand them to the file in one call
+        chunks = []
+        if title:
+            chunks += [f"{title}\n", "=" * len(title) + "\n\n"]
+
+        chunks.append(f"Generated on {generated_at or _timestamp()}\n\n")
 
-            f.write(f"Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+        if data:
+            # Convert to table
+            table = tabulate(data, headers="keys", tablefmt=table_format)
+            chunks += [table, "\n\n"]
 
-            if data:
-                # Convert to table
-                table = tabulate(data, headers="keys", tablefmt=table_format)
-                f.write(table)
-                f.write("\n\n")
+        with open(output_path, 'w') as f:
+            f.writelines(chunks)
 
         return output_path
 
@@ -169,39 +234,27 @@ class Exporter:
             Dictionary mapping formats to output paths
         """
         exported_files = {}
+        # Shared by the markdown and text writers, so every format carries the same timestamp
+        context = _prepare_report(analysis_data)
+
+        renderers = {
+            "json": lambda: self.export_json(analysis_data, f"{filename_base}.json"),
+            # Structured markdown and text reports
+            "markdown": lambda: self._create_markdown_report(
+                analysis_data, f"{filename_base}.md", context=context
+            ),
+            "text": lambda: self._create_text_report(
+                analysis_data, f"{filename_base}.txt", context=context
+            ),
+        }
+        if isinstance(analysis_data.get("data"), list):
+            # Export data section as CSV
+            renderers["csv"] = lambda: self.export_csv(analysis_data["data"], f"{filename_base}.csv")
 
         for fmt in formats:
-            if fmt == "json":
-                path = self.export_json(
-                    analysis_data,
-                    f"{filename_base}.json"
-                )
-                exported_files["json"] = path
-
-            elif fmt == "markdown":
-                # Create structured markdown report
-                path = self._create_markdown_report(
-                    analysis_data,
-                    f"{filename_base}.md"
-                )
-                exported_files["markdown"] = path
-
-            elif fmt == "text":
-                # Create text report
-                path = self._create_text_report(
-                    analysis_data,
-                    f"{filename_base}.txt"
-                )
-                exported_files["text"] = path
-
-            elif fmt == "csv" and "data" in analysis_data:
-                # Export data section as CSV
-                if isinstance(analysis_data["data"], list):
-                    path = self.export_csv(
-                        analysis_data["data"],
-                        f"{filename_base}.csv"
-                    )
-                    exported_files["csv"] = path
+            render = renderers.get(fmt)
+            if render is not None:
+                exported_files[fmt] = render()
 
         return exported_files
 
@@ -209,75 +262,70 @@ class Exporter:
         self,
         analysis_data: Dict[str, Any],
         filename: str,
+        context: Optional[_ReportContext] = None,
     ) -> Path:
         """Create a formatted markdown report."""
         output_path = self.output_dir / filename
+        context = context or _prepare_report(analysis_data)
+
+        # Assemble the report in memory and write the file once
+        buffer = io.StringIO()
+        write = buffer.write
+
+        # Title
+        if "title" in analysis_data:
+            write(f"# {analysis_data['title']}\n\n")
+        else:
+            write("# Analysis Report\n\n")
+
+        # Metadata
+        write(f"**Generated:** {context.generated_at}\n\n")
+
+        if "date_range" in analysis_data:
+            write(f"**Date Range:** {analysis_data['date_range']}\n\n")
+
+        # Summary section
+        if "summary" in analysis_data:
+            write("## Summary\n\n")
+            summary = analysis_data["summary"]
+            if isinstance(summary, dict):
+                for key, value in summary.items():
+                    write(f"- **{key.replace('_', ' ').title()}:** {value}\n")
+            else:
+                write(f"{summary}\n")
+            write("\n")
+
+        # CAGR section
+        if "cagr" in analysis_data:
+            write("## Compound Annual Growth Rates (CAGR)\n\n")
+            if context.cagr_rows:
+                write(_markdown_table(context.cagr_rows))
+                write("\n\n")
+
+        # Data section
+        if "data" in analysis_data:
+            write("## Detailed Data\n\n")
+            data = analysis_data["data"]
+            if isinstance(data, list) and data:
+                write(_markdown_table(data))
+                write("\n\n")
+
+        # Additional sections
+        for key, value in context.extra_sections:
+            write(f"## {key.replace('_', ' ').title()}\n\n")
+
+            if isinstance(value, list) and value:
+                write(_markdown_table(value))
+                write("\n\n")
+            elif isinstance(value, dict):
+                for k, v in value.items():
+                    write(f"- **{k.replace('_', ' ').title()}:** {v}\n")
+                write("\n")
+            else:
+                write(f"{value}\n\n")
 
         with open(output_path, 'w') as f:
-            # Title
-            if "title" in analysis_data:
-                f.write(f"# {analysis_data['title']}\n\n")
-            else:
-                f.write("# Analysis Report\n\n")
-
-            # Metadata
-            f.write(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-
-            if "date_range" in analysis_data:
-                f.write(f"**Date Range:** {analysis_data['date_range']}\n\n")
-
-            # Summary section
-            if "summary" in analysis_data:
-                f.write("## Summary\n\n")
-                summary = analysis_data["summary"]
-                if isinstance(summary, dict):
-                    for key, value in summary.items():
-                        f.write(f"- **{key.replace('_', ' ').title()}:** {value}\n")
-                else:
-                    f.write(f"{summary}\n")
-                f.write("\n")
-
-            # CAGR section
-            if "cagr" in analysis_data:
-                f.write("## Compound Annual Growth Rates (CAGR)\n\n")
-                cagr_data = analysis_data["cagr"]
-                if isinstance(cagr_data, dict):
-                    cagr_list = []
-                    for metric, result in cagr_data.items():
-                        if hasattr(result, 'to_dict'):
-                            cagr_list.append(result.to_dict())
-                        elif isinstance(result, dict):
-                            cagr_list.append(result)
-
-                    if cagr_list:
-                        df = pd.DataFrame(cagr_list)
-                        f.write(df.to_markdown(index=False))
-                        f.write("\n\n")
-
-            # Data section
-            if "data" in analysis_data:
-                f.write("## Detailed Data\n\n")
-                data = analysis_data["data"]
-                if isinstance(data, list) and data:
-                    df = pd.DataFrame(data)
-                    f.write(df.to_markdown(index=False))
-                    f.write("\n\n")
-
-            # Additional sections
-            for key, value in analysis_data.items():
-                if key not in ["title", "summary", "cagr", "data", "date_range"]:
-                    f.write(f"## {key.replace('_', ' ').title()}\n\n")
-
-                    if isinstance(value, list) and value:
-                        df = pd.DataFrame(value)
-                        f.write(df.to_markdown(index=False))
-                        f.write("\n\n")
-                    elif isinstance(value, dict):
-                        for k, v in value.items():
-                            f.write(f"- **{k.replace('_', ' ').title()}:** {v}\n")
-                        f.write("\n")
-                    else:
-                        f.write(f"{value}\n\n")
+            f.write(buffer.getvalue())
 
         return output_path
 
@@ -285,78 +333,76 @@ class Exporter:
         self,
         analysis_data: Dict[str, Any],
         filename: str,
+        context: Optional[_ReportContext] = None,
     ) -> Path:
         """Create a formatted text report."""
         output_path = self.output_dir / filename
+        context = context or _prepare_report(analysis_data)
+
+        # Assemble the report in memory and write the file once
+        buffer = io.StringIO()
+        write = buffer.write
+
+        # Title
+        title = analysis_data.get("title", "Analysis Report")
+        write(f"{title}\n")
+        write("=" * len(title) + "\n\n")
+
+        # Metadata
+        write(f"Generated: {context.generated_at}\n\n")
+
+        if "date_range" in analysis_data:
+            write(f"Date Range: {analysis_data['date_range']}\n\n")
+
+        # Summary
+        if "summary" in analysis_data:
+            write("SUMMARY\n")
+            write(_RULE + "\n")
+            summary = analysis_data["summary"]
+            if isinstance(summary, dict):
+                for key, value in summary.items():
+                    write(f"{key.replace('_', ' ').title()}: {value}\n")
+            else:
+                write(f"{summary}\n")
+            write("\n")
+
+        # CAGR section
+        if "cagr" in analysis_data:
+            write("COMPOUND ANNUAL GROWTH RATES (CAGR)\n")
+            write(_RULE + "\n")
+            if context.cagr_rows:
+                table = tabulate(context.cagr_rows, headers="keys", tablefmt="grid")
+                write(table)
+                write("\n\n")
+
+        # Data section
+        if "data" in analysis_data:
+            write("DETAILED DATA\n")
+            write(_RULE + "\n")
+            data = analysis_data["data"]
+            if isinstance(data, list) and data:
+                table = tabulate(data, headers="keys", tablefmt="grid")
+                write(table)
+                write("\n\n")
+
+        # Additional sections
+        for key, value in context.extra_sections:
+            section_title = key.replace('_', ' ').upper()
+            write(f"{section_title}\n")
+            write(_RULE + "\n")
+
+            if isinstance(value, list) and value:
+                table = tabulate(value, headers="keys", tablefmt="grid")
+                write(table)
+                write("\n\n")
+            elif isinstance(value, dict):
+                for k, v in value.items():
+                    write(f"{k.replace('_', ' ').title()}: {v}\n")
+                write("\n")
+            else:
+                write(f"{value}\n\n")
 
         with open(output_path, 'w') as f:
-            # Title
-            title = analysis_data.get("title", "Analysis Report")
-            f.write(f"{title}\n")
-            f.write("=" * len(title) + "\n\n")
-
-            # Metadata
-            f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-
-            if "date_range" in analysis_data:
-                f.write(f"Date Range: {analysis_data['date_range']}\n\n")
-
-            # Summary
-            if "summary" in analysis_data:
-                f.write("SUMMARY\n")
-                f.write("-" * 80 + "\n")
-                summary = analysis_data["summary"]
-                if isinstance(summary, dict):
-                    for key, value in summary.items():
-                        f.write(f"{key.replace('_', ' ').title()}: {value}\n")
-                else:
-                    f.write(f"{summary}\n")
-                f.write("\n")
-
-            # CAGR section
-            if "cagr" in analysis_data:
-                f.write("COMPOUND ANNUAL GROWTH RATES (CAGR)\n")
-                f.write("-" * 80 + "\n")
-                cagr_data = analysis_data["cagr"]
-                if isinstance(cagr_data, dict):
-                    cagr_list = []
-                    for metric, result in cagr_data.items():
-                        if hasattr(result, 'to_dict'):
-                            cagr_list.append(result.to_dict())
-                        elif isinstance(result, dict):
-                            cagr_list.append(result)
-
-                    if cagr_list:
-                        table = tabulate(cagr_list, headers="keys", tablefmt="grid")
-                        f.write(table)
-                        f.write("\n\n")
-
-            # Data section
-            if "data" in analysis_data:
-                f.write("DETAILED DATA\n")
-                f.write("-" * 80 + "\n")
-                data = analysis_data["data"]
-                if isinstance(data, list) and data:
-                    table = tabulate(data, headers="keys", tablefmt="grid")
-                    f.write(table)
-                    f.write("\n\n")
-
-            # Additional sections
-            for key, value in analysis_data.items():
-                if key not in ["title", "summary", "cagr", "data", "date_range"]:
-                    section_title = key.replace('_', ' ').upper()
-                    f.write(f"{section_title}\n")
-                    f.write("-" * 80 + "\n")
-
-                    if isinstance(value, list) and value:
-                        table = tabulate(value, headers="keys", tablefmt="grid")
-                        f.write(table)
-                        f.write("\n\n")
-                    elif isinstance(value, dict):
-                        for k, v in value.items():
-                            f.write(f"{k.replace('_', ' ').title()}: {v}\n")
-                        f.write("\n")
-                    else:
-                        f.write(f"{value}\n\n")
+            f.write(buffer.getvalue())
 
         return output_path
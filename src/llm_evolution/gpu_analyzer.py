@@ -1,16 +1,57 @@
 """GPU performance analysis module."""
 
-import json
+import copy
+from itertools import groupby
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from types import MappingProxyType
+from typing import List, Dict, Any, Optional, Tuple
 import math
 
+import numpy as np
+
 from .models import GPUMetrics, ComparisonResult
+from .utils import load_json
+
+
+# Metric names accepted by analyze_metric_growth, mapped to GPUMetrics attributes
+_METRIC_MAP = MappingProxyType({
+    'cuda_cores': 'cuda_cores',
+    'compute_cores': 'cuda_cores',
+    'tflops': 'tflops_fp32',
+    'tflops_fp32': 'tflops_fp32',
+    'vram': 'vram_mb',
+    'vram_mb': 'vram_mb',
+    'memory_bandwidth': 'memory_bandwidth_gbps',
+    'memory_bandwidth_gbps': 'memory_bandwidth_gbps',
+    'tdp': 'tdp_watts',
+    'tdp_watts': 'tdp_watts',
+    'price': 'launch_price_usd',
+    'launch_price_usd': 'launch_price_usd',
+    'transistors': 'transistors_millions',
+    'transistors_millions': 'transistors_millions',
+})
 
 
 class GPUAnalyzer:
     """Analyzer for GPU metrics and trends."""
 
+    # Numeric fields exposed as column arrays
+    NUMERIC_FIELDS = (
+        'process_nm',
+        'transistors_millions',
+        'die_size_mm2',
+        'base_clock_mhz',
+        'boost_clock_mhz',
+        'vram_mb',
+        'memory_bandwidth_gbps',
+        'tflops_fp32',
+        'tflops_fp16',
+        'tflops_int8',
+        'tdp_watts',
+        'launch_price_usd',
+    )
+
     def __init__(self, data_path: Optional[Path] = None):
         """Initialize GPU analyzer.
 
@@ -23,37 +64,75 @@ class GPUAnalyzer:
 
         self.data_path = data_path
         self.gpus: List[GPUMetrics] = []
+        self.years = np.empty(0, dtype=np.int32)
+        self.columns: Dict[str, np.ndarray] = {}
+        self._by_name: Dict[str, GPUMetrics] = {}
+        self._by_mfr: Dict[str, List[GPUMetrics]] = {}
+        self._mfr_codes = np.empty(0, dtype=np.intp)
+        self._mfr_index: Dict[str, int] = {}
+        self._ray_tracing = np.empty(0, dtype=bool)
+        self._yearly_maxima: Optional[Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]] = None
+        self._cagr_cache: Dict[Tuple[Optional[int], Optional[int]], Dict[str, ComparisonResult]] = {}
+        self._records: Optional[List[Dict[str, Any]]] = None
         self.load_data()
 
     def load_data(self) -> None:
         """Load GPU data from JSON file."""
-        with open(self.data_path, 'r') as f:
-            data = json.load(f)
+        data = load_json(self.data_path)
 
-        self.gpus = []
-        for item in data:
-            gpu = GPUMetrics(**item)
-            self.gpus.append(gpu)
+        self.gpus = [GPUMetrics(**item) for item in data]
+        self._yearly_maxima = None
+        self._cagr_cache = {}
+        self._records = None
 
         # Sort by year and then by performance
         self.gpus.sort(key=lambda x: (x.year, x.tflops_fp32))
 
+        # Column views (None becomes NaN) for vectorized plotting
+        self.years = np.array([g.year for g in self.gpus], dtype=np.int32)
+        self.columns = {
+            field: np.array([getattr(g, field) for g in self.gpus], dtype=np.float64)
+            for field in self.NUMERIC_FIELDS
+        }
+
+        self._ray_tracing = np.array([g.ray_tracing_support for g in self.gpus], dtype=bool)
+
+        # Case-insensitive name index (first match wins) and manufacturer buckets, in sorted order
+        self._by_name = {}
+        self._by_mfr = {}
+        for gpu in self.gpus:
+            self._by_name.setdefault(gpu.name.lower(), gpu)
+            self._by_mfr.setdefault(gpu.manufacturer.lower(), []).append(gpu)
+
+        # Per-row manufacturer group codes for bincount aggregates
+        self._mfr_index = {mfr: code for code, mfr in enumerate(self._by_mfr)}
+        self._mfr_codes = np.array(
+            [self._mfr_index[g.manufacturer.lower()] for g in self.gpus], dtype=np.intp
+        )
+
     def get_gpus_by_year_range(
         self, start_year: int, end_year: int
     ) -> List[GPUMetrics]:
         """Get GPUs within a year range."""
-        return [g for g in self.gpus if start_year <= g.year <= end_year]
+        lo, hi = self._year_bounds(start_year, end_year)
+        return self.gpus[lo:hi]
+
+    def _year_bounds(self, start_year: Optional[int], end_year: Optional[int]) -> Tuple[int, int]:
+        """Slice bounds of self.gpus (sorted by year) for an inclusive year range.
+
+        A bound of None leaves that side of the range open.
+        """
+        lo = 0 if start_year is None else int(np.searchsorted(self.years, start_year, side='left'))
+        hi = len(self.gpus) if end_year is None else int(np.searchsorted(self.years, end_year, side='right'))
+        return lo, max(lo, hi)
 
     def get_gpu_by_name(self, name: str) -> Optional[GPUMetrics]:
         """Get a specific GPU by name."""
-        for gpu in self.gpus:
-            if gpu.name.lower() == name.lower():
-                return gpu
-        return None
+        return self._by_name.get(name.lower())
 
     def get_gpus_by_manufacturer(self, manufacturer: str) -> List[GPUMetrics]:
         """Get all GPUs from a specific manufacturer."""
-        return [g for g in self.gpus if g.manufacturer.lower() == manufacturer.lower()]
+        return list(self._by_mfr.get(manufacturer.lower(), ()))
 
     def calculate_cagr(
         self, start_value: float, end_value: float, years: int
@@ -71,8 +150,13 @@ class GPUAnalyzer:
         if start_value <= 0 or years <= 0:
             return 0.0
 
-        cagr = (math.pow(end_value / start_value, 1 / years) - 1) * 100
-        return cagr
+        if end_value <= 0:
+            # log is undefined here; pow keeps the old results (-100 at zero, a
+            # real root for a negative end over one year, ValueError otherwise)
+            return (math.pow(end_value / start_value, 1 / years) - 1) * 100
+
+        # expm1/log avoids the cancellation in pow(ratio, 1/years) - 1
+        return math.expm1(math.log(end_value / start_value) / years) * 100
 
     def analyze_metric_growth(
         self,
@@ -108,25 +192,7 @@ class GPUAnalyzer:
         start_gpu = gpus_in_range[0]
         end_gpu = gpus_in_range[-1]
 
-        # Map metric name to attribute
-        metric_map = {
-            'cuda_cores': 'cuda_cores',
-            'compute_cores': 'cuda_cores',
-            'tflops': 'tflops_fp32',
-            'tflops_fp32': 'tflops_fp32',
-            'vram': 'vram_mb',
-            'vram_mb': 'vram_mb',
-            'memory_bandwidth': 'memory_bandwidth_gbps',
-            'memory_bandwidth_gbps': 'memory_bandwidth_gbps',
-            'tdp': 'tdp_watts',
-            'tdp_watts': 'tdp_watts',
-            'price': 'launch_price_usd',
-            'launch_price_usd': 'launch_price_usd',
-            'transistors': 'transistors_millions',
-            'transistors_millions': 'transistors_millions',
-        }
-
-        attr_name = metric_map.get(metric_name.lower(), metric_name)
+        attr_name = _METRIC_MAP.get(metric_name.lower(), metric_name)
 
         try:
             start_value = getattr(start_gpu, attr_name)
@@ -157,6 +223,16 @@ class GPUAnalyzer:
         Returns:
             Dictionary mapping metric names to ComparisonResult objects
         """
+        # Results depend only on the loaded data and the range; callers get their own copies
+        cached = self._cagr_cache.get((start_year, end_year))
+        if cached is None:
+            cached = self._cagr_cache[(start_year, end_year)] = self._compute_all_cagrs(start_year, end_year)
+        return {metric: copy.copy(result) for metric, result in cached.items()}
+
+    def _compute_all_cagrs(
+        self, start_year: Optional[int], end_year: Optional[int]
+    ) -> Dict[str, ComparisonResult]:
+        """Growth results for every major metric with data in the range."""
         metrics = [
             'tflops_fp32',
             'vram_mb',
@@ -190,48 +266,41 @@ class GPUAnalyzer:
         Returns:
             Dictionary with efficiency metric time series
         """
-        gpus = self.gpus
-        if start_year:
-            gpus = [g for g in gpus if g.year >= start_year]
-        if end_year:
-            gpus = [g for g in gpus if g.year <= end_year]
-
-        tflops_per_watt = []
-        tflops_per_dollar = []
-        transistor_density = []
-
-        for gpu in gpus:
-            metrics = gpu.compute_efficiency_metrics()
-
-            if 'tflops_per_watt' in metrics:
-                tflops_per_watt.append({
-                    'year': gpu.year,
-                    'name': gpu.name,
-                    'manufacturer': gpu.manufacturer,
-                    'value': metrics['tflops_per_watt']
-                })
+        # Falsy bounds mean no limit here
+        lo, hi = self._year_bounds(start_year or None, end_year or None)
+        gpus = self.gpus[lo:hi]
+
+        tflops = self.columns['tflops_fp32'][lo:hi]
+        tdp = self.columns['tdp_watts'][lo:hi]
+        price = self.columns['launch_price_usd'][lo:hi]
+        transistors = self.columns['transistors_millions'][lo:hi]
+        die_size = self.columns['die_size_mm2'][lo:hi]
+
+        # Same conditions and arithmetic as GPUMetrics.compute_efficiency_metrics,
+        # evaluated over whole columns (missing values are NaN and never qualify)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            series = {
+                'tflops_per_watt': ((tflops > 0) & (tdp > 0), tflops / tdp),
+                'tflops_per_dollar': ((tflops > 0) & (price > 0), tflops / price),
+                'transistor_density_per_mm2': (
+                    (transistors > 0) & (die_size > 0), transistors * 1_000_000 / die_size
+                ),
+            }
 
-            if 'tflops_per_dollar' in metrics:
-                tflops_per_dollar.append({
-                    'year': gpu.year,
-                    'name': gpu.name,
-                    'manufacturer': gpu.manufacturer,
-                    'value': metrics['tflops_per_dollar']
-                })
+        trends = {}
+        for metric, (defined, values) in series.items():
+            values = values.tolist()
+            trends[metric] = [
+                {
+                    'year': gpus[i].year,
+                    'name': gpus[i].name,
+                    'manufacturer': gpus[i].manufacturer,
+                    'value': values[i],
+                }
+                for i in np.flatnonzero(defined).tolist()
+            ]
 
-            if 'transistor_density_per_mm2' in metrics:
-                transistor_density.append({
-                    'year': gpu.year,
-                    'name': gpu.name,
-                    'manufacturer': gpu.manufacturer,
-                    'value': metrics['transistor_density_per_mm2']
-                })
-
-        return {
-            'tflops_per_watt': tflops_per_watt,
-            'tflops_per_dollar': tflops_per_dollar,
-            'transistor_density_per_mm2': transistor_density,
-        }
+        return trends
 
     def get_manufacturer_comparison(self) -> Dict[str, Dict[str, Any]]:
         """Compare GPUs across manufacturers.
@@ -242,51 +311,70 @@ class GPUAnalyzer:
         manufacturers = ['NVIDIA', 'AMD', 'Intel']
         comparison = {}
 
+        # One grouped reduction per column; bincount adds in row order like sum()
+        codes = self._mfr_codes
+        groups = len(self._mfr_index)
+        counts = np.bincount(codes, minlength=groups)
+        tflops_sums = np.bincount(codes, weights=self.columns['tflops_fp32'], minlength=groups)
+        vram_sums = np.bincount(codes, weights=self.columns['vram_mb'], minlength=groups)
+        tdp_sums = np.bincount(codes, weights=self.columns['tdp_watts'], minlength=groups)
+        rt_counts = np.bincount(codes, weights=self._ray_tracing, minlength=groups)
+
         for mfr in manufacturers:
-            mfr_gpus = self.get_gpus_by_manufacturer(mfr)
-            if not mfr_gpus:
+            code = self._mfr_index.get(mfr.lower())
+            if code is None:
                 continue
-
-            # Calculate averages
-            avg_tflops = sum(g.tflops_fp32 for g in mfr_gpus) / len(mfr_gpus)
-            avg_vram = sum(g.vram_mb for g in mfr_gpus) / len(mfr_gpus)
-            avg_tdp = sum(g.tdp_watts for g in mfr_gpus) / len(mfr_gpus)
-
-            # Count features
-            rt_count = sum(1 for g in mfr_gpus if g.ray_tracing_support)
+            mfr_gpus = self._by_mfr[mfr.lower()]
 
             comparison[mfr] = {
-                'count': len(mfr_gpus),
-                'avg_tflops_fp32': avg_tflops,
-                'avg_vram_mb': avg_vram,
-                'avg_tdp_watts': avg_tdp,
-                'ray_tracing_count': rt_count,
+                'count': int(counts[code]),
+                'avg_tflops_fp32': float(tflops_sums[code] / counts[code]),
+                'avg_vram_mb': float(vram_sums[code] / counts[code]),
+                'avg_tdp_watts': float(tdp_sums[code] / counts[code]),
+                'ray_tracing_count': int(rt_counts[code]),
                 'first_year': mfr_gpus[0].year,
                 'latest_year': mfr_gpus[-1].year,
             }
 
         return comparison
 
+    def _compute_yearly_maxima(self) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Fastest and largest-memory GPU of each year, found in one pass per load."""
+        if self._yearly_maxima is None:
+            performance = []
+            memory = []
+
+            # self.gpus is sorted by year; max() keeps the first of equal values
+            for year, group in groupby(self.gpus, key=attrgetter('year')):
+                year_gpus = list(group)
+                fastest = max(year_gpus, key=attrgetter('tflops_fp32'))
+                largest = max(year_gpus, key=attrgetter('vram_mb'))
+
+                performance.append({
+                    'year': year,
+                    'tflops': fastest.tflops_fp32,
+                    'gpu_name': fastest.name,
+                    'manufacturer': fastest.manufacturer,
+                })
+                memory.append({
+                    'year': year,
+                    'vram_mb': largest.vram_mb,
+                    'vram_gb': largest.vram_mb / 1024,
+                    'gpu_name': largest.name,
+                    'manufacturer': largest.manufacturer,
+                })
+
+            self._yearly_maxima = (performance, memory)
+
+        return self._yearly_maxima
+
     def get_performance_evolution(self) -> List[Dict[str, Any]]:
         """Get performance evolution over time (max TFLOPS per year).
 
         Returns:
             List of yearly maximum performance
         """
-        year_max = {}
-        for gpu in self.gpus:
-            year = gpu.year
-            tflops = gpu.tflops_fp32
-
-            if year not in year_max or tflops > year_max[year]['tflops']:
-                year_max[year] = {
-                    'year': year,
-                    'tflops': tflops,
-                    'gpu_name': gpu.name,
-                    'manufacturer': gpu.manufacturer,
-                }
-
-        return sorted(year_max.values(), key=lambda x: x['year'])
+        return [dict(entry) for entry in self._compute_yearly_maxima()[0]]
 
     def get_memory_evolution(self) -> List[Dict[str, Any]]:
         """Get memory capacity evolution over time.
@@ -294,21 +382,7 @@ class GPUAnalyzer:
         Returns:
             List of yearly maximum VRAM
         """
-        year_max = {}
-        for gpu in self.gpus:
-            year = gpu.year
-            vram = gpu.vram_mb
-
-            if year not in year_max or vram > year_max[year]['vram_mb']:
-                year_max[year] = {
-                    'year': year,
-                    'vram_mb': vram,
-                    'vram_gb': vram / 1024,
-                    'gpu_name': gpu.name,
-                    'manufacturer': gpu.manufacturer,
-                }
-
-        return sorted(year_max.values(), key=lambda x: x['year'])
+        return [dict(entry) for entry in self._compute_yearly_maxima()[1]]
 
     def get_architectural_milestones(self) -> List[Dict[str, Any]]:
         """Identify major architectural milestones.
@@ -317,45 +391,51 @@ class GPUAnalyzer:
             List of milestone GPUs
         """
         milestones = []
+        if not self.gpus:
+            return milestones
 
-        for gpu in self.gpus:
-            is_milestone = False
-            reasons = []
-
-            # First GPU
-            if gpu == self.gpus[0]:
-                is_milestone = True
-                reasons.append("First in dataset")
-
-            # First with ray tracing
-            if gpu.ray_tracing_support and not any(
-                g.ray_tracing_support for g in self.gpus if g.year < gpu.year
-            ):
-                is_milestone = True
-                reasons.append("First with hardware ray tracing")
-
-            # First with tensor cores
-            if gpu.tensor_cores and not any(
-                g.tensor_cores for g in self.gpus if g.year < gpu.year
-            ):
-                is_milestone = True
-                reasons.append("First with Tensor cores")
-
-            # Major process node transitions
-            if gpu.process_nm in [90, 28, 16, 7, 5]:
-                prev_gpus = [g for g in self.gpus if g.year < gpu.year]
-                if not prev_gpus or all(g.process_nm > gpu.process_nm for g in prev_gpus):
-                    is_milestone = True
+        first_gpu = self.gpus[0]
+
+        # What GPUs from strictly earlier years had; self.gpus is sorted by year,
+        # so this is updated once each year's group has been checked
+        ray_tracing_before = False
+        tensor_cores_before = False
+        min_process_before = math.inf
+
+        for _, year_group in groupby(self.gpus, key=attrgetter('year')):
+            year_gpus = list(year_group)
+
+            for gpu in year_gpus:
+                reasons = []
+
+                # First GPU
+                if gpu == first_gpu:
+                    reasons.append("First in dataset")
+
+                # First with ray tracing
+                if gpu.ray_tracing_support and not ray_tracing_before:
+                    reasons.append("First with hardware ray tracing")
+
+                # First with tensor cores
+                if gpu.tensor_cores and not tensor_cores_before:
+                    reasons.append("First with Tensor cores")
+
+                # Major process node transitions (smaller than every earlier node)
+                if gpu.process_nm in [90, 28, 16, 7, 5] and gpu.process_nm < min_process_before:
                     reasons.append(f"First {gpu.process_nm}nm process")
 
-            if is_milestone:
-                milestones.append({
-                    'name': gpu.name,
-                    'year': gpu.year,
-                    'manufacturer': gpu.manufacturer,
-                    'architecture': gpu.architecture,
-                    'reasons': reasons,
-                })
+                if reasons:
+                    milestones.append({
+                        'name': gpu.name,
+                        'year': gpu.year,
+                        'manufacturer': gpu.manufacturer,
+                        'architecture': gpu.architecture,
+                        'reasons': reasons,
+                    })
+
+            ray_tracing_before = ray_tracing_before or any(g.ray_tracing_support for g in year_gpus)
+            tensor_cores_before = tensor_cores_before or any(g.tensor_cores for g in year_gpus)
+            min_process_before = min(min_process_before, min(g.process_nm for g in year_gpus))
 
         return milestones
 
@@ -364,21 +444,29 @@ class GPUAnalyzer:
         if not self.gpus:
             return {}
 
+        manufacturers = list(dict.fromkeys(g.manufacturer for g in self.gpus))
+
         return {
             'total_gpus': len(self.gpus),
             'year_range': f"{self.gpus[0].year}-{self.gpus[-1].year}",
-            'manufacturers': list(set(g.manufacturer for g in self.gpus)),
+            'manufacturers': manufacturers,
             'manufacturer_count': {
-                mfr: len(self.get_gpus_by_manufacturer(mfr))
-                for mfr in set(g.manufacturer for g in self.gpus)
+                mfr: len(self._by_mfr[mfr.lower()])
+                for mfr in manufacturers
             },
             'earliest_gpu': self.gpus[0].name,
             'latest_gpu': self.gpus[-1].name,
-            'max_tflops': max(g.tflops_fp32 for g in self.gpus),
-            'max_vram_gb': max(g.vram_mb for g in self.gpus) / 1024,
-            'ray_tracing_count': sum(1 for g in self.gpus if g.ray_tracing_support),
+            # argmax picks the first maximum, as max() does, and the GPU keeps the original value
+            'max_tflops': self.gpus[int(np.argmax(self.columns['tflops_fp32']))].tflops_fp32,
+            'max_vram_gb': self.gpus[int(np.argmax(self.columns['vram_mb']))].vram_mb / 1024,
+            'ray_tracing_count': int(np.count_nonzero(self._ray_tracing)),
         }
 
     def to_dict(self) -> List[Dict[str, Any]]:
-        """Convert all GPUs to dictionaries."""
-        return [gpu.to_dict() for gpu in self.gpus]
+        """Convert all GPUs to dictionaries.
+
+        The records are built once per load; callers get fresh copies.
+        """
+        if self._records is None:
+            self._records = [gpu.to_dict() for gpu in self.gpus]
+        return [dict(record) for record in self._records]
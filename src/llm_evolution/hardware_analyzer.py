@@ -1,16 +1,32 @@
 """Hardware performance analysis module."""
 
-import json
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 import math
 
+import numpy as np
+
 from .models import HardwareMetrics, ComparisonResult
+from .utils import load_json
 
 
 class HardwareAnalyzer:
     """Analyzer for computing hardware metrics and trends."""
 
+    # Numeric fields exposed as column arrays
+    NUMERIC_FIELDS = (
+        'cpu_cores',
+        'cpu_transistors',
+        'cpu_clock_mhz',
+        'cpu_process_nm',
+        'ram_mb',
+        'storage_mb',
+        'performance_mips',
+        'performance_flops',
+        'power_watts',
+        'price_usd',
+    )
+
     def __init__(self, data_path: Optional[Path] = None):
         """Initialize hardware analyzer.
 
@@ -23,12 +39,13 @@ class HardwareAnalyzer:
 
         self.data_path = data_path
         self.systems: List[HardwareMetrics] = []
+        self.years = np.empty(0, dtype=np.int32)
+        self.columns: Dict[str, np.ndarray] = {}
         self.load_data()
 
     def load_data(self) -> None:
         """Load hardware data from JSON file."""
-        with open(self.data_path, 'r') as f:
-            data = json.load(f)
+        data = load_json(self.data_path)
 
         self.systems = []
         for item in data:
@@ -38,6 +55,13 @@ class HardwareAnalyzer:
         # Sort by year
         self.systems.sort(key=lambda x: x.year)
 
+        # Column views (None becomes NaN) for vectorized plotting
+        self.years = np.array([s.year for s in self.systems], dtype=np.int32)
+        self.columns = {
+            field: np.array([getattr(s, field) for s in self.systems], dtype=np.float64)
+            for field in self.NUMERIC_FIELDS
+        }
+
     def get_systems_by_year_range(
         self, start_year: int, end_year: int
     ) -> List[HardwareMetrics]:
@@ -1,16 +1,33 @@
 """LLM performance and scaling analysis module."""
 
-import json
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 import math
 
+import numpy as np
+
 from .models import LLMMetrics, ComparisonResult
+from .utils import load_json
 
 
 class LLMAnalyzer:
     """Analyzer for Large Language Model metrics and trends."""
 
+    # Numeric fields exposed as column arrays
+    NUMERIC_FIELDS = (
+        'parameters_billions',
+        'training_tokens_billions',
+        'training_compute_flops',
+        'context_window',
+        'capability_score_reasoning',
+        'capability_score_coding',
+        'capability_score_math',
+        'capability_score_knowledge',
+        'capability_score_multilingual',
+        'cost_per_1m_input_tokens',
+        'cost_per_1m_output_tokens',
+    )
+
     def __init__(self, data_path: Optional[Path] = None):
         """Initialize LLM analyzer.
 
@@ -23,12 +40,13 @@ class LLMAnalyzer:
 
         self.data_path = data_path
         self.models: List[LLMMetrics] = []
+        self.years = np.empty(0, dtype=np.int32)
+        self.columns: Dict[str, np.ndarray] = {}
         self.load_data()
 
     def load_data(self) -> None:
         """Load LLM data from JSON file."""
-        with open(self.data_path, 'r') as f:
-            data = json.load(f)
+        data = load_json(self.data_path)
 
         self.models = []
         for item in data:
@@ -38,6 +56,13 @@ class LLMAnalyzer:
         # Sort by year and then by parameters
         self.models.sort(key=lambda x: (x.year, x.parameters_billions))
 
+        # Column views (None becomes NaN) for vectorized plotting
+        self.years = np.array([m.year for m in self.models], dtype=np.int32)
+        self.columns = {
+            field: np.array([getattr(m, field) for m in self.models], dtype=np.float64)
+            for field in self.NUMERIC_FIELDS
+        }
+
     def get_models_by_year_range(
         self, start_year: int, end_year: int
     ) -> List[LLMMetrics]:
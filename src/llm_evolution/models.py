@@ -1,8 +1,8 @@
 """Data models for hardware and LLM metrics."""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Sequence
 
 
 @dataclass
@@ -522,6 +522,15 @@ class CloudInstance:
 
         return metrics
 
+    @classmethod
+    def from_tuple(cls, values: Sequence[Any]) -> "CloudInstance":
+        """Create an instance from values given in CLOUD_INSTANCE_FIELDS order.
+
+        Positional construction avoids matching ~30 keyword arguments by name
+        and still runs the __post_init__ validation.
+        """
+        return cls(*values)
+
     def calculate_training_cost(
         self,
         training_hours: float,
@@ -681,3 +690,7 @@ class CloudInstance:
         base_dict.update(self.compute_cost_metrics())
 
         return base_dict
+
+
+# CloudInstance field names in constructor order, for CloudInstance.from_tuple
+CLOUD_INSTANCE_FIELDS = tuple(f.name for f in fields(CloudInstance))
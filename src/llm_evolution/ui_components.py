@@ -5,9 +5,11 @@ This module provides styled UI components that leverage Rich's automatic
 terminal width handling and responsive design capabilities.
 """
 
-from typing import Optional, List, Tuple
+import re
+from typing import Optional, List, Tuple, Pattern
 from rich.console import Console, Group
 from rich.panel import Panel
+from rich.prompt import Prompt
 from rich.table import Table
 from rich.text import Text
 from rich.layout import Layout
@@ -132,6 +134,38 @@ def build_choice_validator(num_keys: list, letter_keys: list):
     return num_keys + letter_keys
 
 
+def build_choice_pattern(num_keys, letter_keys) -> Pattern[str]:
+    """
+    Compile a regex that matches exactly one number or letter shortcut.
+
+    Args:
+        num_keys: Valid number keys
+        letter_keys: Valid letter keys
+
+    Returns:
+        Compiled pattern intended for ``fullmatch``
+    """
+    # Longest keys first so "12" is not shadowed by "1"
+    keys = sorted([*num_keys, *letter_keys], key=len, reverse=True)
+    return re.compile("|".join(re.escape(key) for key in keys))
+
+
+class ChoicePrompt(Prompt):
+    """Prompt that validates choices with a precompiled regex.
+
+    Subclasses set ``pattern``; ``choices`` is still passed to ``ask`` so
+    the options are shown to the user.
+    """
+
+    pattern: Optional[Pattern[str]] = None
+
+    def check_choice(self, value: str) -> bool:
+        """Check value against the pattern (or the choices list if unset)."""
+        if self.pattern is None:
+            return super().check_choice(value)
+        return self.pattern.fullmatch(value.strip()) is not None
+
+
 def normalize_choice(choice: str, key_map: dict) -> str:
     """
     Normalize user choice to a standard key.
@@ -411,13 +445,16 @@ def show_help(console: Console):
     Prompt.ask("", default="")
 
 
-def print_section_header(console: Console, text: str, icon: str = ""):
-    """Print a styled section header."""
+def create_section_header(text: str, icon: str = "") -> Group:
+    """Create a styled section header preceded by a blank line."""
     header = Text()
     if icon:
         header.append(f"{icon} ", style=THEME['accent'])
     header.append(text, style=f"bold {THEME['primary']}")
 
-    console.print()
-    console.print(header)
-    console.print(create_divider())
+    return Group(Text(""), header, create_divider())
+
+
+def print_section_header(console: Console, text: str, icon: str = ""):
+    """Print a styled section header."""
+    console.print(create_section_header(text, icon))
@@ -0,0 +1,6 @@
+"""Shared helpers."""
+
+from .json_io import load_json, write_json
+from .plot_settings import PLOT_FORMAT_VERSION, PNG_COMPRESS_LEVEL
+
+__all__ = ['load_json', 'write_json', 'PLOT_FORMAT_VERSION', 'PNG_COMPRESS_LEVEL']
@@ -0,0 +1,71 @@
+"""JSON file loading and writing with an optional fast codec."""
+
+import json
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    # Match json.dump(..., default=str): stringify keys, and send dataclasses and
+    # datetimes through the default hook instead of orjson's native encoders.
+    # numpy scalars and arrays are written as numbers, as json does for np.float64
+    _ORJSON_DUMP_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_SERIALIZE_NUMPY
+    )
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Fallback encoder for orjson, which rejects float subclasses that json writes as numbers."""
+    if isinstance(obj, float):
+        return float(obj)
+    return str(obj)
+
+
+def load_json(path: Union[str, Path]) -> Any:
+    """Parse a JSON file, using orjson when it is installed.
+
+    Args:
+        path: JSON file to read
+
+    Returns:
+        Parsed JSON document
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        json.JSONDecodeError: If JSON is malformed (orjson's error subclasses it)
+    """
+    if orjson is not None:
+        return orjson.loads(Path(path).read_bytes())
+
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def write_json(path: Union[str, Path], data: Any, pretty: bool = True) -> None:
+    """Write data as JSON, using orjson when it is installed.
+
+    Values JSON can't represent are written with str(). Documents orjson
+    rejects (e.g. integers wider than 64 bits) fall back to the json module.
+
+    Args:
+        path: JSON file to write
+        data: Data to serialize
+        pretty: Indent with two spaces
+    """
+    if orjson is not None:
+        option = _ORJSON_DUMP_OPTIONS | (orjson.OPT_INDENT_2 if pretty else 0)
+        try:
+            payload = orjson.dumps(data, default=_orjson_default, option=option)
+        except orjson.JSONEncodeError:
+            pass
+        else:
+            Path(path).write_bytes(payload)
+            return
+
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2 if pretty else None, default=str)
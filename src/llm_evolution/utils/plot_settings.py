@@ -0,0 +1,26 @@
+"""Chart output settings, importable without loading matplotlib."""
+
+import os
+import warnings
+
+# Bump when chart code changes the rendered output, so charts saved by an
+# earlier version are redrawn instead of reused
+PLOT_FORMAT_VERSION = 1
+
+
+def _png_compress_level(default: int = 1) -> int:
+    """Read LLMEVO_PNG_LEVEL, clamped to zlib's 0-9; unparsable values use the default."""
+    raw = os.environ.get("LLMEVO_PNG_LEVEL", "").strip()
+    if not raw:
+        return default
+    try:
+        level = int(raw)
+    except ValueError:
+        warnings.warn(f"Ignoring LLMEVO_PNG_LEVEL={raw!r}: not an integer, using {default}")
+        return default
+    return min(max(level, 0), 9)
+
+
+# zlib level for saved PNGs; low levels encode much faster at a modest size cost.
+# PNG is lossless either way; set LLMEVO_PNG_LEVEL=9 for the smallest files.
+PNG_COMPRESS_LEVEL = _png_compress_level()
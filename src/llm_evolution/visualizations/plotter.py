@@ -10,6 +10,7 @@ import seaborn as sns
 import numpy as np
 
 from ..models import HardwareMetrics, LLMMetrics
+from ..utils.plot_settings import PNG_COMPRESS_LEVEL
 
 
 class Plotter:
@@ -30,6 +31,44 @@ class Plotter:
 
         self.figsize = figsize
         sns.set_palette("husl")
+        self._fig = None
+
+    def _figure(self, figsize: Optional[tuple] = None) -> plt.Figure:
+        """Return the shared figure, cleared and resized for a new plot.
+
+        Creating and tearing down a Figure per chart is expensive, so one
+        figure is kept for the lifetime of the plotter and made current
+        for the pyplot calls that follow.
+
+        Args:
+            figsize: Figure size for this plot (defaults to self.figsize)
+
+        Returns:
+            The cleared figure
+        """
+        figsize = figsize or self.figsize
+        if self._fig is None or not plt.fignum_exists(self._fig.number):
+            self._fig = plt.figure(figsize=figsize)
+        else:
+            self._fig.clear()
+            self._fig.set_size_inches(figsize)
+            plt.figure(self._fig.number)
+        return self._fig
+
+    def _save(self, output_path: Optional[Path] = None) -> None:
+        """Save the current figure, or show it when no path is given.
+
+        Args:
+            output_path: Path to save the plot
+        """
+        if not output_path:
+            plt.show()
+            return
+
+        kwargs = {}
+        if Path(output_path).suffix.lower() == '.png':
+            kwargs['pil_kwargs'] = {'compress_level': PNG_COMPRESS_LEVEL}
+        self._fig.savefig(output_path, dpi=300, bbox_inches='tight', **kwargs)
 
     def plot_hardware_evolution(
         self,
@@ -58,7 +97,7 @@ class Plotter:
 
         years, values = zip(*filtered_data)
 
-        plt.figure(figsize=self.figsize)
+        self._figure()
         plt.plot(years, values, marker='o', linewidth=2, markersize=6)
 
         if log_scale:
@@ -71,12 +110,46 @@ class Plotter:
         plt.grid(True, alpha=0.3)
         plt.tight_layout()
 
-        if output_path:
-            plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        else:
-            plt.show()
+        self._save(output_path)
+
+    def plot_hardware_evolution_arr(
+        self,
+        years: np.ndarray,
+        values: np.ndarray,
+        metric: str,
+        output_path: Optional[Path] = None,
+        log_scale: bool = True,
+    ) -> None:
+        """Plot hardware metric evolution from column arrays.
+
+        Array counterpart of plot_hardware_evolution; expects years in
+        ascending order, with missing values encoded as NaN.
 
-        plt.close()
+        Args:
+            years: Year of each system
+            values: Metric value of each system
+            metric: Metric name used for labels
+            output_path: Path to save the plot
+            log_scale: Use logarithmic scale for y-axis
+        """
+        mask = np.isfinite(values) & (values > 0)
+        if not mask.any():
+            return
+
+        self._figure()
+        plt.plot(years[mask], values[mask], marker='o', linewidth=2, markersize=6)
+
+        if log_scale:
+            plt.yscale('log')
+
+        plt.xlabel('Year', fontsize=12, fontweight='bold')
+        plt.ylabel(metric.replace('_', ' ').title(), fontsize=12, fontweight='bold')
+        plt.title(f'{metric.replace("_", " ").title()} Evolution Over Time',
+                  fontsize=14, fontweight='bold')
+        plt.grid(True, alpha=0.3)
+        plt.tight_layout()
+
+        self._save(output_path)
 
     def plot_moores_law_comparison(
         self,
@@ -96,7 +169,7 @@ class Plotter:
         years = [s.year for s in systems]
         actual = [s.cpu_transistors for s in systems]
 
-        plt.figure(figsize=self.figsize)
+        self._figure()
         plt.plot(years, actual, marker='o', linewidth=2, markersize=6,
                  label='Actual', color='#2E86AB')
         plt.plot(years, predictions[:len(years)], marker='s', linewidth=2,
@@ -112,12 +185,7 @@ class Plotter:
         plt.grid(True, alpha=0.3)
         plt.tight_layout()
 
-        if output_path:
-            plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        else:
-            plt.show()
-
-        plt.close()
+        self._save(output_path)
 
     def plot_cagr_heatmap(
         self,
@@ -133,7 +201,7 @@ class Plotter:
         metrics = list(cagr_data.keys())
         values = [[cagr_data[m]] for m in metrics]
 
-        plt.figure(figsize=(10, len(metrics) * 0.8))
+        self._figure((10, len(metrics) * 0.8))
         sns.heatmap(
             values,
             annot=True,
@@ -150,12 +218,7 @@ class Plotter:
                   fontsize=14, fontweight='bold')
         plt.tight_layout()
 
-        if output_path:
-            plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        else:
-            plt.show()
-
-        plt.close()
+        self._save(output_path)
 
     def plot_llm_capability_radar(
         self,
@@ -175,7 +238,8 @@ class Plotter:
         angles = [n / float(num_vars) * 2 * math.pi for n in range(num_vars)]
         angles += angles[:1]
 
-        fig, ax = plt.subplots(figsize=self.figsize, subplot_kw=dict(projection='polar'))
+        fig = self._figure()
+        ax = fig.add_subplot(projection='polar')
 
         # Plot each model
         colors = plt.cm.tab10(np.linspace(0, 1, len(models)))
@@ -206,12 +270,7 @@ class Plotter:
                   pad=20)
         plt.tight_layout()
 
-        if output_path:
-            plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        else:
-            plt.show()
-
-        plt.close()
+        self._save(output_path)
 
     def plot_llm_parameter_scaling(
         self,
@@ -239,7 +298,7 @@ class Plotter:
         params = [year_max[y]['params'] for y in years]
         names = [year_max[y]['name'] for y in years]
 
-        plt.figure(figsize=self.figsize)
+        self._figure()
         bars = plt.bar(years, params, color='#3A86FF', alpha=0.8, edgecolor='black')
 
         # Add model names on top of bars
@@ -254,12 +313,7 @@ class Plotter:
         plt.grid(True, alpha=0.3, axis='y')
         plt.tight_layout()
 
-        if output_path:
-            plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        else:
-            plt.show()
-
-        plt.close()
+        self._save(output_path)
 
     def plot_cost_efficiency(
         self,
@@ -282,7 +336,7 @@ class Plotter:
         names = [d['name'] for d in data]
         efficiency = [d['cost_efficiency'] for d in data]
 
-        plt.figure(figsize=(12, 8))
+        self._figure((12, 8))
         bars = plt.barh(names, efficiency, color='#06FFA5', alpha=0.8,
                         edgecolor='black')
 
@@ -294,12 +348,7 @@ class Plotter:
         plt.grid(True, alpha=0.3, axis='x')
         plt.tight_layout()
 
-        if output_path:
-            plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        else:
-            plt.show()
-
-        plt.close()
+        self._save(output_path)
 
     def plot_context_window_evolution(
         self,
@@ -327,7 +376,7 @@ class Plotter:
         contexts = [year_max[y]['context'] for y in years]
         names = [year_max[y]['name'] for y in years]
 
-        plt.figure(figsize=self.figsize)
+        self._figure()
         plt.plot(years, contexts, marker='o', linewidth=2, markersize=8,
                  color='#FF006E')
 
@@ -346,12 +395,7 @@ class Plotter:
         plt.grid(True, alpha=0.3)
         plt.tight_layout()
 
-        if output_path:
-            plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        else:
-            plt.show()
-
-        plt.close()
+        self._save(output_path)
 
     def plot_growth_factors(
         self,
@@ -371,7 +415,7 @@ class Plotter:
             metrics.append(metric_name.replace('_', ' ').title())
             growth_factors.append(result.growth_factor)
 
-        plt.figure(figsize=(12, 8))
+        self._figure((12, 8))
         bars = plt.barh(metrics, growth_factors, color='#8338EC', alpha=0.8,
                         edgecolor='black')
 
@@ -387,12 +431,7 @@ class Plotter:
         plt.grid(True, alpha=0.3, axis='x')
         plt.tight_layout()
 
-        if output_path:
-            plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        else:
-            plt.show()
-
-        plt.close()
+        self._save(output_path)
 
     def plot_gpu_performance_evolution(
         self,
@@ -434,7 +473,7 @@ class Plotter:
             else:
                 colors.append('#888888')
 
-        plt.figure(figsize=self.figsize)
+        self._figure()
         plt.plot(years, tflops, marker='o', linewidth=2, markersize=8,
                  color='#2E86AB', alpha=0.7)
 
@@ -461,12 +500,7 @@ class Plotter:
 
         plt.tight_layout()
 
-        if output_path:
-            plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        else:
-            plt.show()
-
-        plt.close()
+        self._save(output_path)
 
     def plot_gpu_memory_evolution(
         self,
@@ -498,7 +532,7 @@ class Plotter:
             else:
                 colors.append('#888888')
 
-        plt.figure(figsize=self.figsize)
+        self._figure()
         plt.scatter(years, vram_gb, s=100, c=colors, edgecolor='black',
                    linewidth=1, alpha=0.7)
 
@@ -519,12 +553,7 @@ class Plotter:
 
         plt.tight_layout()
 
-        if output_path:
-            plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        else:
-            plt.show()
-
-        plt.close()
+        self._save(output_path)
 
     def plot_gpu_efficiency(
         self,
@@ -566,7 +595,7 @@ class Plotter:
             else:
                 colors.append('#888888')
 
-        plt.figure(figsize=self.figsize)
+        self._figure()
         plt.scatter(years, efficiency, s=100, c=colors, edgecolor='black',
                    linewidth=1, alpha=0.7)
 
@@ -587,12 +616,7 @@ class Plotter:
 
         plt.tight_layout()
 
-        if output_path:
-            plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        else:
-            plt.show()
-
-        plt.close()
+        self._save(output_path)
 
     def plot_gpu_manufacturer_comparison(
         self,
@@ -621,7 +645,8 @@ class Plotter:
             else:
                 mfr_colors.append('#888888')
 
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+        fig = self._figure((14, 6))
+        ax1, ax2 = fig.subplots(1, 2)
 
         # GPU count by manufacturer
         ax1.bar(manufacturers, counts, color=mfr_colors, alpha=0.8, edgecolor='black')
@@ -637,12 +662,7 @@ class Plotter:
 
         plt.tight_layout()
 
-        if output_path:
-            plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        else:
-            plt.show()
-
-        plt.close()
+        self._save(output_path)
 
     def plot_gpu_price_performance(
         self,
@@ -686,7 +706,7 @@ class Plotter:
             else:
                 colors.append('#888888')
 
-        plt.figure(figsize=self.figsize)
+        self._figure()
         scatter = plt.scatter(tflops, prices, s=100, c=colors, edgecolor='black',
                             linewidth=1, alpha=0.7)
 
@@ -706,12 +726,7 @@ class Plotter:
 
         plt.tight_layout()
 
-        if output_path:
-            plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        else:
-            plt.show()
-
-        plt.close()
+        self._save(output_path)
 
     def plot_cloud_cost_comparison(
         self,
@@ -738,7 +753,7 @@ class Plotter:
             else:
                 colors.append('#888888')
 
-        plt.figure(figsize=self.figsize)
+        self._figure()
         bars = plt.bar(providers, costs, color=colors, edgecolor='black', linewidth=1.5)
 
         for bar, cost, instance_type in zip(bars, costs, instance_types):
@@ -753,12 +768,7 @@ class Plotter:
         plt.grid(True, alpha=0.3, axis='y')
         plt.tight_layout()
 
-        if output_path:
-            plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        else:
-            plt.show()
-
-        plt.close()
+        self._save(output_path)
 
     def plot_cost_efficiency_ranking(
         self,
@@ -785,7 +795,7 @@ class Plotter:
             else:
                 colors.append('#888888')
 
-        plt.figure(figsize=(12, 8))
+        self._figure((12, 8))
         bars = plt.barh(range(len(labels)), tflops_per_dollar, color=colors,
                        edgecolor='black', linewidth=1)
 
@@ -798,12 +808,7 @@ class Plotter:
         plt.grid(True, alpha=0.3, axis='x')
         plt.tight_layout()
 
-        if output_path:
-            plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        else:
-            plt.show()
-
-        plt.close()
+        self._save(output_path)
 
     def plot_spot_savings(
         self,
@@ -820,7 +825,8 @@ class Plotter:
         savings_percent = [d['savings_percent'] for d in data]
         annual_savings = [d['annual_savings_usd'] for d in data]
 
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 8))
+        fig = self._figure((16, 8))
+        ax1, ax2 = fig.subplots(1, 2)
 
         colors = []
         for d in data:
@@ -857,12 +863,7 @@ class Plotter:
 
         plt.tight_layout()
 
-        if output_path:
-            plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        else:
-            plt.show()
-
-        plt.close()
+        self._save(output_path)
 
     def plot_gpu_price_evolution(
         self,
@@ -873,7 +874,7 @@ class Plotter:
         if not evolution_data:
             return
 
-        plt.figure(figsize=(14, 8))
+        self._figure((14, 8))
 
         for gpu_model, price_data in evolution_data.items():
             if not price_data:
@@ -909,12 +910,7 @@ class Plotter:
         plt.grid(True, alpha=0.3)
         plt.tight_layout()
 
-        if output_path:
-            plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        else:
-            plt.show()
-
-        plt.close()
+        self._save(output_path)
 
     def plot_training_cost_breakdown(
         self,
@@ -925,7 +921,8 @@ class Plotter:
         if not cost_estimate:
             return
 
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(14, 10))
+        fig = self._figure((14, 10))
+        (ax1, ax2), (ax3, ax4) = fig.subplots(2, 2)
 
         compute_cost = cost_estimate['compute_cost_usd']
         storage_cost = cost_estimate['storage_cost_usd']
@@ -1004,12 +1001,7 @@ Training Hours: {cost_estimate.get('training_hours', 0):.1f}
                     fontsize=14, fontweight='bold', y=0.98)
         plt.tight_layout(rect=[0, 0, 1, 0.96])
 
-        if output_path:
-            plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        else:
-            plt.show()
-
-        plt.close()
+        self._save(output_path)
 
     def plot_provider_comparison_matrix(
         self,
@@ -1040,7 +1032,7 @@ Training Hours: {cost_estimate.get('training_hours', 0):.1f}
             max_val = max(row) if max(row) > 0 else 1
             normalized_data.append([v / max_val for v in row])
 
-        plt.figure(figsize=(10, 6))
+        self._figure((10, 6))
         sns.heatmap(normalized_data, annot=[[f'{v:.1f}' for v in row] for row in matrix_data],
                    fmt='s', cmap='YlOrRd', xticklabels=providers,
                    yticklabels=metric_labels, cbar_kws={'label': 'Normalized Value'})
@@ -1050,9 +1042,4 @@ Training Hours: {cost_estimate.get('training_hours', 0):.1f}
         plt.ylabel('Metric', fontsize=12, fontweight='bold')
         plt.tight_layout()
 
-        if output_path:
-            plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        else:
-            plt.show()
-
-        plt.close()
+        self._save(output_path)
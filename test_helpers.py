@@ -0,0 +1,146 @@
+"""Parity tests for the fast paths behind ranking, markdown tables, JSON I/O and chart reuse."""
+
+import json
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from llm_evolution import cli
+from llm_evolution.cloud_cost_analyzer import _rank_rows
+from llm_evolution.exports.exporter import _markdown_table
+from llm_evolution.gpu_analyzer import GPUAnalyzer
+from llm_evolution.utils import json_io
+
+
+# _rank_rows: partition cutoff must give the head of the stable full ordering
+
+@pytest.mark.parametrize("seed", range(20))
+def test_rank_rows_top_k_is_head_of_full_ordering(seed):
+    rng = np.random.default_rng(seed)
+    # Few distinct values, so most rows tie with another
+    scores = rng.integers(0, 5, size=30).astype(float)
+    rows = np.flatnonzero(rng.random(30) < 0.8)
+
+    expected = sorted(rows.tolist(), key=lambda row: scores[row], reverse=True)
+    assert _rank_rows(rows, scores).tolist() == expected
+
+    for top_k in range(len(rows) + 2):
+        assert _rank_rows(rows, scores, top_k).tolist() == expected[:top_k]
+
+
+def test_rank_rows_negative_top_k_is_empty():
+    scores = np.array([3.0, 1.0, 2.0])
+    assert _rank_rows(np.arange(3), scores, -1).tolist() == []
+
+
+# _markdown_table: tabulate fast path must match pandas to_markdown
+
+MARKDOWN_CASES = {
+    "str_int_float": [{"a": "x", "b": 1, "c": 1.5}, {"a": "y", "b": 20, "c": 0.25}],
+    "int_only": [{"a": 1, "b": 2}, {"a": 30, "b": 4}],
+    "int_and_float": [{"a": 1, "b": 2.5}, {"a": 3, "b": 4.0}],
+    "float_only": [{"a": 1.0}, {"a": 2.125}],
+    "str_only": [{"name": "H100"}, {"name": "A100"}],
+    "none_cells": [{"a": "x", "b": None}, {"a": "y", "b": 2}],
+    "bool_cells": [{"a": "x", "b": True}, {"a": "y", "b": False}],
+    "bool_and_int": [{"a": True, "b": 1}, {"a": False, "b": 2}],
+    # pandas renders an all-bool frame as 1/0
+    "bool_only": [{"a": True}, {"a": False}],
+    # and upcasts int columns of an all-numeric frame with a float column
+    "wide_int_and_float": [{"a": 2.5, "b": 123456789012345678}],
+    "missing_key": [{"a": "x", "b": 1}, {"a": "y"}],
+    "extra_key": [{"a": 1}, {"a": 2, "b": "z"}],
+    "reordered_keys": [{"a": 1, "b": "x"}, {"b": "y", "a": 2}],
+    "nested_values": [{"a": [1, 2], "b": {"k": 1}}, {"a": [], "b": {}}],
+    "large_and_small": [{"a": "x", "b": 1e-6, "c": 123456789}, {"a": "y", "b": 3e10, "c": -5}],
+}
+
+
+@pytest.mark.parametrize("rows", MARKDOWN_CASES.values(), ids=MARKDOWN_CASES.keys())
+def test_markdown_table_matches_pandas(rows):
+    assert _markdown_table(rows) == pd.DataFrame(rows).to_markdown(index=False)
+
+
+# write_json / load_json: orjson and json paths must round-trip the same data
+
+JSON_DOCUMENT = {
+    "title": "GPU Évolution",
+    "values": [1, 2.5, 5e-06, -3, None, True],
+    "nested": {"key": [{"a": 1}, {"b": "two"}]},
+    "huge": 2 ** 70,
+}
+
+
+@pytest.fixture(params=["orjson", "json"])
+def codec(request, monkeypatch):
+    if request.param == "orjson":
+        if json_io.orjson is None:
+            pytest.skip("orjson not installed")
+    else:
+        monkeypatch.setattr(json_io, "orjson", None)
+    return request.param
+
+
+@pytest.mark.parametrize("pretty", [True, False])
+def test_json_round_trip(codec, pretty, tmp_path):
+    path = tmp_path / "doc.json"
+    json_io.write_json(path, JSON_DOCUMENT, pretty=pretty)
+
+    assert json_io.load_json(path) == JSON_DOCUMENT
+    assert json.loads(path.read_text()) == JSON_DOCUMENT
+
+
+def test_write_json_matches_json_default_str(codec, tmp_path):
+    class Tag:
+        def __str__(self):
+            return "tag"
+
+    data = {1: Tag(), "when": pd.Timestamp("2024-01-02"), "price": np.float64(1.5)}
+    path = tmp_path / "doc.json"
+    json_io.write_json(path, data)
+
+    assert json_io.load_json(path) == json.loads(json.dumps(data, default=str))
+
+
+def test_load_json_errors(codec, tmp_path):
+    with pytest.raises(FileNotFoundError):
+        json_io.load_json(tmp_path / "missing.json")
+
+    bad = tmp_path / "bad.json"
+    bad.write_text("{not json")
+    with pytest.raises(json.JSONDecodeError):
+        json_io.load_json(bad)
+
+
+# _fingerprint: chart reuse keys
+
+def test_fingerprint_is_stable_and_data_sensitive():
+    assert cli._fingerprint({"a": 1}, b"raw") == cli._fingerprint({"a": 1}, b"raw")
+    assert cli._fingerprint({"a": 1}) != cli._fingerprint({"a": 2})
+
+
+def test_fingerprint_tracks_png_level_and_format_version(monkeypatch):
+    base = cli._fingerprint([1, 2, 3])
+
+    monkeypatch.setattr(cli, "PNG_COMPRESS_LEVEL", cli.PNG_COMPRESS_LEVEL + 1)
+    assert cli._fingerprint([1, 2, 3]) != base
+
+    monkeypatch.undo()
+    monkeypatch.setattr(cli, "PLOT_FORMAT_VERSION", cli.PLOT_FORMAT_VERSION + 1)
+    assert cli._fingerprint([1, 2, 3]) != base
+
+
+def test_gpu_fingerprint_ignores_export_side_effects():
+    gpus = GPUAnalyzer().gpus
+    before = cli._fingerprint(list(map(cli.GPU_PLOT_FIELDS, gpus)))
+
+    for gpu in gpus:
+        gpu.to_dict()
+
+    assert cli._fingerprint(list(map(cli.GPU_PLOT_FIELDS, gpus))) == before